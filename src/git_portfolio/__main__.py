@@ -3,45 +3,51 @@ from __future__ import annotations
 
 import functools
 import sys
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Iterable
+from typing import Optional
 from typing import TypeVar
 from typing import cast
 
 import click
 
-import git_portfolio.config_manager as cm
+import git_portfolio.domain.clone_options as co
 import git_portfolio.domain.config as c
 import git_portfolio.domain.gh_connection_settings as cs
-import git_portfolio.github_service as ghs
-import git_portfolio.prompt as p
-import git_portfolio.request_objects.issue_list as il
 import git_portfolio.responses as res
-import git_portfolio.use_cases.config_init as ci
-import git_portfolio.use_cases.config_repos as cr
-import git_portfolio.use_cases.gh_close_issue as ghcli
-import git_portfolio.use_cases.gh_create_issue as ghci
-import git_portfolio.use_cases.gh_create_pr as ghcp
-import git_portfolio.use_cases.gh_delete_branch as ghdb
-import git_portfolio.use_cases.gh_merge_pr as ghmp
-import git_portfolio.use_cases.gh_reopen_issue as ghri
 import git_portfolio.use_cases.git as git
 import git_portfolio.use_cases.git_clone as gcuc
 import git_portfolio.use_cases.poetry as poetry
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    import git_portfolio.config_manager as cm
+
+
 F = TypeVar("F", bound=Callable[..., Any])
-CONFIG_MANAGER = cm.ConfigManager()
+# created on first use, so that `--help` does not load any config
+CONFIG_MANAGER: cm.ConfigManager | None = None
 
 
-def _echo_outputs(responses: list[res.Response]) -> None:
-    for response in responses:
-        if bool(response):
-            success = cast(res.ResponseSuccess, response)
-            click.secho(success.value)
-        else:
-            failure = cast(res.ResponseFailure, response)
-            click.secho(f"{failure.value['message']}", fg="red")
+def _get_config_manager() -> cm.ConfigManager:
+    """Return the config manager, loading config on first call."""
+    global CONFIG_MANAGER
+    if CONFIG_MANAGER is None:
+        import git_portfolio.config_manager as cm
+
+        CONFIG_MANAGER = cm.ConfigManager()
+    return CONFIG_MANAGER
+
+
+def _echo_output(response: res.Response) -> None:
+    if bool(response):
+        success = cast(res.ResponseSuccess, response)
+        click.secho(success.value)
+    else:
+        failure = cast(res.ResponseFailure, response)
+        click.secho(f"{failure.value['message']}", fg="red")
 
 
 def command_config_check(func: F) -> F:
@@ -49,15 +55,18 @@ def command_config_check(func: F) -> F:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if CONFIG_MANAGER.config_is_empty():
+        if _get_config_manager().config_is_empty():
             click.secho(
                 "Error: no config found, please run `gitp config init`.",
                 fg="red",
             )
             sys.exit(3)
         else:
-            responses = func(*args, **kwargs)
-            _echo_outputs(responses)
+            # commands may return an iterator to output results as they arrive
+            responses = []
+            for response in func(*args, **kwargs):
+                _echo_output(response)
+                responses.append(response)
             for response in responses:
                 if not bool(response):
                     sys.exit(4)
@@ -68,19 +77,36 @@ def command_config_check(func: F) -> F:
 
 @click.group("cli")
 @click.version_option()
-def main() -> None:
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Number of repositories processed in parallel [default: number of CPUs, "
+        "8 for GitHub commands]."
+    ),
+)
+def main(jobs: int | None) -> None:
     """Git Portfolio."""
     pass
 
 
+def _get_jobs() -> int | None:
+    """Return `--jobs` option given to the root command, if any."""
+    return cast(
+        Optional[int], click.get_current_context().find_root().params.get("jobs")
+    )
+
+
 def _get_connection_settings(config: c.Config) -> cs.GhConnectionSettings:
     return cs.GhConnectionSettings(config.github_access_token, config.github_hostname)
 
 
 @command_config_check
 def _call_git_use_case(command: str, args: tuple[str]) -> list[res.Response]:
-    return git.GitUseCase().execute(
-        CONFIG_MANAGER.config.github_selected_repos, command, args
+    return git.GitUseCase(_get_jobs()).execute(
+        _get_config_manager().config.github_selected_repos, command, args
     )
 
 
@@ -106,17 +132,77 @@ def checkout(args: tuple[str]) -> list[res.Response]:
 
 
 @main.command()
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Number of clones running at the same time [default: `gitp --jobs` or "
+        f"{gcuc.DEFAULT_JOBS}]."
+    ),
+)
+@click.option(
+    "--depth",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Create shallow clones with history truncated to this number of commits.",
+)
+@click.option(
+    "--filter",
+    "filter_spec",
+    type=click.Choice(["blob:none", "tree:0"]),
+    default=None,
+    help="Create partial clones: blobless (blob:none) or treeless (tree:0).",
+)
+@click.option(
+    "--single-branch",
+    is_flag=True,
+    default=False,
+    help="Clone only the history of the default branch.",
+)
+@click.option(
+    "--reference-cache",
+    is_flag=True,
+    default=False,
+    help=(
+        "Keep bare mirrors in ~/.gitp/mirrors and clone using them as reference, "
+        "only downloading objects that are new since the last clone. Clones "
+        "copy the objects they use, so they keep working when mirrors change."
+    ),
+)
+@click.option(
+    "--existing",
+    type=click.Choice(["fail", "skip", "fetch"]),
+    default="fail",
+    show_default=True,
+    help="What to do with repositories already present in current folder.",
+)
 @command_config_check
-def clone() -> list[res.Response]:
+def clone(
+    jobs: int | None,
+    depth: int | None,
+    filter_spec: str | None,
+    single_branch: bool,
+    reference_cache: bool,
+    existing: str,
+) -> Iterable[res.Response]:
     """Batch `git clone` command on current folder. Does not accept aditional args."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
 
-    return gcuc.GitCloneUseCase(github_service).execute(
-        CONFIG_MANAGER.config.github_selected_repos
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+
+    options = co.CloneOptions(
+        depth, filter_spec, single_branch, reference_cache, existing
+    )
+    # the root --jobs applies unless the clone one is given
+    jobs = jobs or _get_jobs() or gcuc.DEFAULT_JOBS
+    return gcuc.GitCloneUseCase(github_service, jobs, options).execute_as_completed(
+        config_manager.config.github_selected_repos
     )
 
 
@@ -252,11 +338,15 @@ def group_prs() -> None:
 @group_config.command("init")
 def config_init() -> None:
     """Initialize `gitp` config."""
+    import git_portfolio.prompt as p
+    import git_portfolio.use_cases.config_init as ci
+
+    config_manager = _get_config_manager()
     while True:
         settings = p.InquirerPrompter.connect_github(
-            CONFIG_MANAGER.config.github_access_token
+            config_manager.config.github_access_token
         )
-        response = ci.ConfigInitUseCase(CONFIG_MANAGER).execute(settings)
+        response = ci.ConfigInitUseCase(config_manager).execute(settings)
         if bool(response):
             success = cast(res.ResponseSuccess, response)
             click.secho(success.value)
@@ -272,21 +362,26 @@ def config_init() -> None:
 @command_config_check
 def config_repos() -> list[res.Response]:
     """Configure current working `gitp` repositories."""
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.use_cases.config_repos as cr
+
+    config_manager = _get_config_manager()
     new_repos = p.InquirerPrompter.new_repos(
-        CONFIG_MANAGER.config.github_selected_repos
+        config_manager.config.github_selected_repos
     )
     if not new_repos:
         return [res.ResponseSuccess()]
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(settings)
     try:
-        github_service = ghs.GithubService(settings)
+        repo_names = github_service.get_repo_names()
     except ghs.GithubServiceError as gse:
         return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
 
-    repo_names = github_service.get_repo_names()
     selected_repos = p.InquirerPrompter.select_repos(repo_names)
     return [
-        cr.ConfigReposUseCase(CONFIG_MANAGER).execute(
+        cr.ConfigReposUseCase(config_manager).execute(
             github_service.get_config(), selected_repos
         )
     ]
@@ -296,31 +391,44 @@ def config_repos() -> list[res.Response]:
 @command_config_check
 def create_issues() -> list[res.Response]:
     """Batch creation of issues on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.use_cases.gh_create_issue as ghci
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up()
 
     issue = p.InquirerPrompter.create_issues(
-        CONFIG_MANAGER.config.github_selected_repos
+        config_manager.config.github_selected_repos
     )
-    return ghci.GhCreateIssueUseCase(CONFIG_MANAGER, github_service).execute(issue)
+    return ghci.GhCreateIssueUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(issue)
 
 
 @group_issues.command("close")
 @command_config_check
 def close_issues() -> list[res.Response]:
     """Batch close issues on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.request_objects.issue_list as il
+    import git_portfolio.use_cases.gh_close_issue as ghcli
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up(("open",))
 
     list_object = "issue"
     title_query = p.InquirerPrompter.query_by_title(
-        CONFIG_MANAGER.config.github_selected_repos, list_object
+        config_manager.config.github_selected_repos, list_object
     )
     list_request = il.build_list_request(
         filters={
@@ -329,24 +437,30 @@ def close_issues() -> list[res.Response]:
             "title__contains": title_query,
         }
     )
-    return ghcli.GhCloseIssueUseCase(CONFIG_MANAGER, github_service).execute(
-        list_request
-    )
+    return ghcli.GhCloseIssueUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(list_request)
 
 
 @group_issues.command("reopen")
 @command_config_check
 def reopen_issues() -> list[res.Response]:
     """Batch reopen issues on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.request_objects.issue_list as il
+    import git_portfolio.use_cases.gh_reopen_issue as ghri
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up(("closed",))
 
     list_object = "issue"
     title_query = p.InquirerPrompter.query_by_title(
-        CONFIG_MANAGER.config.github_selected_repos, list_object
+        config_manager.config.github_selected_repos, list_object
     )
     list_request = il.build_list_request(
         filters={
@@ -355,9 +469,9 @@ def reopen_issues() -> list[res.Response]:
             "title__contains": title_query,
         }
     )
-    return ghri.GhReopenIssueUseCase(CONFIG_MANAGER, github_service).execute(
-        list_request
-    )
+    return ghri.GhReopenIssueUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(list_request)
 
 
 @main.command("poetry", context_settings={"ignore_unknown_options": True})
@@ -366,7 +480,7 @@ def reopen_issues() -> list[res.Response]:
 def poetry_cmd(args: tuple[str]) -> list[res.Response]:
     """Batch `poetry` command."""
     return poetry.PoetryUseCase().execute(
-        CONFIG_MANAGER.config.github_selected_repos, "poetry", args
+        _get_config_manager().config.github_selected_repos, "poetry", args
     )
 
 
@@ -374,14 +488,20 @@ def poetry_cmd(args: tuple[str]) -> list[res.Response]:
 @command_config_check
 def create_prs() -> list[res.Response]:
     """Batch creation of pull requests on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.request_objects.issue_list as il
+    import git_portfolio.use_cases.gh_create_pr as ghcp
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up(("open",))
 
     pr = p.InquirerPrompter.create_pull_requests(
-        CONFIG_MANAGER.config.github_selected_repos
+        config_manager.config.github_selected_repos
     )
     # list for linked issues
     list_request = il.build_list_request(
@@ -391,24 +511,30 @@ def create_prs() -> list[res.Response]:
             "title__contains": pr.issues_title_query,
         }
     )
-    return ghcp.GhCreatePrUseCase(CONFIG_MANAGER, github_service).execute(
-        pr, list_request
-    )
+    return ghcp.GhCreatePrUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(pr, list_request)
 
 
 @group_prs.command("close")
 @command_config_check
 def close_prs() -> list[res.Response]:
     """Batch close pull requests on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.request_objects.issue_list as il
+    import git_portfolio.use_cases.gh_close_issue as ghcli
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up(("open",))
 
     list_object = "pull request"
     title_query = p.InquirerPrompter.query_by_title(
-        CONFIG_MANAGER.config.github_selected_repos, list_object
+        config_manager.config.github_selected_repos, list_object
     )
     list_request = il.build_list_request(
         filters={
@@ -417,24 +543,30 @@ def close_prs() -> list[res.Response]:
             "title__contains": title_query,
         }
     )
-    return ghcli.GhCloseIssueUseCase(CONFIG_MANAGER, github_service).execute(
-        list_request
-    )
+    return ghcli.GhCloseIssueUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(list_request)
 
 
 @group_prs.command("reopen")
 @command_config_check
 def reopen_prs() -> list[res.Response]:
     """Batch reopen pull requests on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.request_objects.issue_list as il
+    import git_portfolio.use_cases.gh_reopen_issue as ghri
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up(("closed",))
 
     list_object = "pull request"
     title_query = p.InquirerPrompter.query_by_title(
-        CONFIG_MANAGER.config.github_selected_repos, list_object
+        config_manager.config.github_selected_repos, list_object
     )
     list_request = il.build_list_request(
         filters={
@@ -443,42 +575,60 @@ def reopen_prs() -> list[res.Response]:
             "title__contains": title_query,
         }
     )
-    return ghri.GhReopenIssueUseCase(CONFIG_MANAGER, github_service).execute(
-        list_request
-    )
+    return ghri.GhReopenIssueUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(list_request)
 
 
 @group_prs.command("merge")
 @command_config_check
 def merge_prs() -> list[res.Response]:
     """Batch merge of pull requests on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.use_cases.gh_merge_pr as ghmp
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up()
+
     try:
-        github_service = ghs.GithubService(settings)
+        username = github_service.get_username()
     except ghs.GithubServiceError as gse:
         return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
 
     pr_merge = p.InquirerPrompter.merge_pull_requests(
-        github_service.get_username(),
-        CONFIG_MANAGER.config.github_selected_repos,
+        username, config_manager.config.github_selected_repos
     )
-    return ghmp.GhMergePrUseCase(CONFIG_MANAGER, github_service).execute(pr_merge)
+    return ghmp.GhMergePrUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(pr_merge)
 
 
 @group_branches.command("delete")
 @command_config_check
 def delete_branches() -> list[res.Response]:
     """Batch deletion of branches on GitHub."""
-    settings = _get_connection_settings(CONFIG_MANAGER.config)
-    try:
-        github_service = ghs.GithubService(settings)
-    except ghs.GithubServiceError as gse:
-        return [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, gse)]
+    import git_portfolio.github_service as ghs
+    import git_portfolio.prompt as p
+    import git_portfolio.use_cases.gh_delete_branch as ghdb
+
+    config_manager = _get_config_manager()
+    settings = _get_connection_settings(config_manager.config)
+    github_service = ghs.GithubService(
+        settings, config_manager.config.github_selected_repos
+    )
+    github_service.warm_up()
 
     branch = p.InquirerPrompter.delete_branches(
-        CONFIG_MANAGER.config.github_selected_repos
+        config_manager.config.github_selected_repos
     )
-    return ghdb.GhDeleteBranchUseCase(CONFIG_MANAGER, github_service).execute(branch)
+    return ghdb.GhDeleteBranchUseCase(
+        config_manager, github_service, jobs=_get_jobs()
+    ).execute(branch)
 
 
 main.add_command(group_config)
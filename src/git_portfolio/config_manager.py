@@ -1,12 +1,17 @@
 """Configuration manager module."""
+from __future__ import annotations
+
+import json
 import os
 import pathlib
 
-import yaml
-
 import git_portfolio.domain.config as c
 
 
+# bump when the cached representation of the config changes
+CACHE_VERSION = 1
+
+
 class ConfigManager:
     """Configuration manager class."""
 
@@ -14,15 +19,24 @@ class ConfigManager:
         """Load config if it exists."""
         self.config_folder = os.path.join(os.path.expanduser("~"), ".gitp")
         self.config_path = os.path.join(self.config_folder, config_filename)
+        self.cache_path = f"{os.path.splitext(self.config_path)[0]}.cache.json"
 
         if os.path.exists(self.config_path):
             print("Loading previous config...\n")
+            cached_config = self._load_cache()
+            if cached_config:
+                self.config = cached_config
+                return
+            # YAML is only needed when the cache is stale
+            import yaml
+
             with open(self.config_path, "r+") as config_file:
                 try:
                     data = yaml.safe_load(config_file)
                     if data:
                         try:
                             self.config = c.Config(**data)
+                            self._save_cache()
                             return
                         except TypeError:
                             config_file.truncate(0)
@@ -30,6 +44,33 @@ class ConfigManager:
                     config_file.truncate(0)
         self.config = c.Config("", "", [])
 
+    def _config_stamp(self) -> list[int]:
+        """Return modification time and size of YAML config file."""
+        stat = os.stat(self.config_path)
+        return [CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    def _load_cache(self) -> c.Config | None:
+        """Return config from cache if it is fresh."""
+        try:
+            with open(self.cache_path) as cache_file:
+                cache = json.load(cache_file)
+            if cache["stamp"] != self._config_stamp():
+                return None
+            return c.Config(**cache["config"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cache(self) -> None:
+        """Write parsed config next to the YAML file."""
+        cache = {"stamp": self._config_stamp(), "config": vars(self.config)}
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
     def config_is_empty(self) -> bool:
         """Check if config is empty."""
         if self.config.github_selected_repos and self.config.github_access_token:
@@ -39,9 +80,12 @@ class ConfigManager:
     def save_config(self) -> None:
         """Write config to YAML file."""
         if not self.config_is_empty():
+            import yaml
+
             pathlib.Path(self.config_folder).mkdir(parents=True, exist_ok=True)
             config_dict = vars(self.config)
             with open(self.config_path, "w") as config_file:
                 yaml.dump(config_dict, config_file)
+            self._save_cache()
         else:
             raise AttributeError
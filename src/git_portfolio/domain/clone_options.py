@@ -0,0 +1,16 @@
+"""Clone options model."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CloneOptions:
+    """Clone options class."""
+
+    depth: int | None = None
+    filter_spec: str | None = None
+    single_branch: bool = False
+    reference_cache: bool = False
+    # what to do with repositories already in the workspace: fail, skip or fetch
+    existing: str = "fail"
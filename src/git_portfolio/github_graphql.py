@@ -0,0 +1,479 @@
+"""GitHub GraphQL module."""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+import git_portfolio.rate_limiter as rl
+
+
+# GitHub rejects queries that could return more nodes than this
+NODE_LIMIT = 500000
+# keeps each response small enough to be answered before GitHub times out
+MAX_REPOS_PER_QUERY = 50
+PAGE_SIZE = 100
+LABELS_PAGE_SIZE = 20
+# mutations of one document run one after the other within a single request,
+# the rate limiter still spaces them out one by one
+MAX_MUTATIONS_PER_DOCUMENT = 20
+MUTATION_RETRIES = 3
+# error types of servers whose schema lacks something we ask for
+SCHEMA_ERROR_TYPES = frozenset({"undefinedField", "argumentNotAccepted"})
+
+
+class GraphqlError(Exception):
+    """Error answered by the GraphQL API."""
+
+    pass
+
+
+class GraphqlUnavailableError(GraphqlError):
+    """GraphQL API or part of the schema used is missing on the server."""
+
+    pass
+
+
+@dataclass
+class ListedIssue:
+    """Issue or pull request as listed in a repository."""
+
+    number: int
+    title: str
+    body: str
+    labels: set[str]
+    pull_request: bool
+    node_id: str
+    # "open" or "closed", merged pull requests are closed
+    state: str = ""
+
+
+@dataclass
+class PullRequestRef:
+    """Open pull request found for a base and head."""
+
+    number: int
+    node_id: str
+
+
+@dataclass
+class BranchRef:
+    """Branch lookup result."""
+
+    exists: bool
+    node_id: str
+
+
+@dataclass
+class IssueTarget:
+    """Repository issues are created in."""
+
+    node_id: str
+    has_issues: bool
+    # labels found by name, missing ones only exist after REST creates them
+    label_ids: dict[str, str]
+
+
+@dataclass
+class BranchComparison:
+    """Head branch compared to a base branch."""
+
+    base_exists: bool
+    head_exists: bool
+    # commits of head missing from base, None when they could not be compared
+    ahead_by: int | None
+
+
+class GraphqlClient:
+    """Client of the GraphQL API sharing a requests session."""
+
+    def __init__(self, session: requests.Session, url: str) -> None:
+        """Constructor.
+
+        Args:
+            session: authenticated session.
+            url: GraphQL endpoint.
+        """
+        self.session = session
+        self.url = url
+
+    def execute(self, query: str) -> tuple[dict[str, Any], dict[str, str]]:
+        """Run a GraphQL document.
+
+        Args:
+            query: GraphQL document.
+
+        Raises:
+            GraphqlUnavailableError: when the server lacks the API or schema used.
+            GraphqlError: when the request fails as a whole.
+
+        Returns:
+            tuple[dict[str, Any], dict[str, str]]: data and error message by top
+                level alias.
+        """
+        try:
+            response = self.session.post(self.url, json={"query": query})
+        except requests.RequestException as error:
+            raise GraphqlError(str(error)) from error
+        if response.status_code in (404, 410):
+            raise GraphqlUnavailableError(f"GraphQL API not found at {self.url}")
+        try:
+            payload = response.json()
+        except ValueError:
+            raise GraphqlError(f"HTTP {response.status_code}") from None
+        if not isinstance(payload, dict):
+            raise GraphqlError(f"HTTP {response.status_code}")
+
+        errors = self._alias_errors(payload.get("errors") or [])
+        data = payload.get("data")
+        if response.status_code != 200 or not isinstance(data, dict):
+            raise GraphqlError(
+                payload.get("message") or f"HTTP {response.status_code}"
+            )
+        return data, errors
+
+    @staticmethod
+    def _alias_errors(errors: list[dict[str, Any]]) -> dict[str, str]:
+        """Return error messages by top level alias, raise for the others."""
+        alias_errors: dict[str, str] = {}
+        for error in errors:
+            message = str(error.get("message", ""))
+            if error.get("type") in SCHEMA_ERROR_TYPES or (
+                error.get("extensions", {}).get("code") in SCHEMA_ERROR_TYPES
+            ):
+                raise GraphqlUnavailableError(message)
+            path = error.get("path") or []
+            if not path:
+                raise GraphqlError(message)
+            alias_errors.setdefault(str(path[0]), message)
+        return alias_errors
+
+
+def literal(value: str) -> str:
+    """Return GraphQL string literal."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def chunks(items: list[Any], size: int) -> list[list[Any]]:
+    """Split items in lists of at most size items."""
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def query_repositories(
+    client: GraphqlClient,
+    repos: list[str],
+    fields: str,
+    nodes_per_repo: int,
+) -> dict[str, dict[str, Any]]:
+    """Read the same fields of many repositories with aliased queries.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        fields: selection set of each repository.
+        nodes_per_repo: maximum nodes the selection can return.
+
+    Returns:
+        dict[str, dict[str, Any]]: repository data by full name, missing for
+            repositories that could not be read.
+    """
+    size = max(1, min(MAX_REPOS_PER_QUERY, NODE_LIMIT // nodes_per_repo))
+    found = {}
+    for chunk in chunks(repos, size):
+        selections = []
+        for index, repo in enumerate(chunk):
+            owner, name = repo.split("/")
+            selections.append(
+                f"r{index}: repository(owner: {literal(owner)}, "
+                f"name: {literal(name)}) {{ {fields} }}"
+            )
+        data, _ = client.execute(f"query {{ {' '.join(selections)} }}")
+        for index, repo in enumerate(chunk):
+            node = data.get(f"r{index}")
+            if node:
+                found[repo] = node
+    return found
+
+
+def _complete(connection: dict[str, Any]) -> bool:
+    """Return whether a connection returned all of its nodes."""
+    return not connection["pageInfo"]["hasNextPage"]
+
+
+def list_issues(
+    client: GraphqlClient, repos: list[str], state: str | None
+) -> dict[str, list[ListedIssue]]:
+    """List issues and pull requests of many repositories, newest first.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        state: "open", "closed" or "all". Defaults to open like the REST API.
+
+    Returns:
+        dict[str, list[ListedIssue]]: issues by repository, missing for
+            repositories with more than a page of them or of their labels.
+    """
+    issue_states = {"closed": "[CLOSED]", "all": "[OPEN, CLOSED]"}.get(
+        state or "", "[OPEN]"
+    )
+    pull_states = {
+        "closed": "[CLOSED, MERGED]",
+        "all": "[OPEN, CLOSED, MERGED]",
+    }.get(state or "", "[OPEN]")
+    items = (
+        "pageInfo { hasNextPage } nodes { id number title body state createdAt "
+        f"labels(first: {LABELS_PAGE_SIZE}) {{ totalCount nodes {{ name }} }} }}"
+    )
+    order = "orderBy: {field: CREATED_AT, direction: DESC}"
+    fields = (
+        f"issues(first: {PAGE_SIZE}, states: {issue_states}, {order}) "
+        f"{{ {items} }} "
+        f"pullRequests(first: {PAGE_SIZE}, states: {pull_states}, {order}) "
+        f"{{ {items} }}"
+    )
+    nodes_per_repo = 2 * PAGE_SIZE * (1 + LABELS_PAGE_SIZE)
+    found = {}
+    nodes = query_repositories(client, repos, fields, nodes_per_repo)
+    for repo, node in nodes.items():
+        if not (_complete(node["issues"]) and _complete(node["pullRequests"])):
+            continue
+        listed = [(issue, False) for issue in node["issues"]["nodes"]] + [
+            (pull, True) for pull in node["pullRequests"]["nodes"]
+        ]
+        if any(
+            item["labels"]["totalCount"] > len(item["labels"]["nodes"])
+            for item, _ in listed
+        ):
+            continue
+        listed.sort(key=lambda item: str(item[0]["createdAt"]), reverse=True)
+        found[repo] = [
+            ListedIssue(
+                item["number"],
+                item["title"],
+                item["body"],
+                {label["name"] for label in item["labels"]["nodes"]},
+                pull_request,
+                item["id"],
+                "open" if item["state"] == "OPEN" else "closed",
+            )
+            for item, pull_request in listed
+        ]
+    return found
+
+
+def list_pull_requests(
+    client: GraphqlClient, repos: list[str], base: str, head: str, head_owner: str
+) -> dict[str, list[PullRequestRef]]:
+    """Find open pull requests from a head branch to a base in many repositories.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        base: base branch name.
+        head: head branch name.
+        head_owner: owner of the head repository, as in "owner:branch".
+
+    Returns:
+        dict[str, list[PullRequestRef]]: pull requests by repository.
+    """
+    fields = (
+        f"pullRequests(first: 10, states: [OPEN], baseRefName: {literal(base)}, "
+        f"headRefName: {literal(head)}) {{ nodes {{ id number "
+        "headRepositoryOwner { login } } }"
+    )
+    found = {}
+    for repo, node in query_repositories(client, repos, fields, 10).items():
+        found[repo] = [
+            PullRequestRef(pull["number"], pull["id"])
+            for pull in node["pullRequests"]["nodes"]
+            if (pull["headRepositoryOwner"] or {}).get("login", "").lower()
+            == head_owner.lower()
+        ]
+    return found
+
+
+def find_branches(
+    client: GraphqlClient, repos: list[str], branch: str
+) -> dict[str, BranchRef]:
+    """Look a branch up in many repositories.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        branch: branch name.
+
+    Returns:
+        dict[str, BranchRef]: lookup result by repository.
+    """
+    fields = f"ref(qualifiedName: {literal(f'refs/heads/{branch}')}) {{ id }}"
+    return {
+        repo: BranchRef(bool(node["ref"]), (node["ref"] or {}).get("id", ""))
+        for repo, node in query_repositories(client, repos, fields, 1).items()
+    }
+
+
+def compare_branches(
+    client: GraphqlClient, repos: list[str], base: str, head: str
+) -> dict[str, BranchComparison]:
+    """Compare a head branch to a base branch in many repositories.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        base: base branch name.
+        head: head branch name.
+
+    Returns:
+        dict[str, BranchComparison]: comparison by repository.
+    """
+    fields = (
+        f"base: ref(qualifiedName: {literal(f'refs/heads/{base}')}) "
+        f"{{ compare(headRef: {literal(head)}) {{ aheadBy }} }} "
+        f"head: ref(qualifiedName: {literal(f'refs/heads/{head}')}) {{ id }}"
+    )
+    found = {}
+    for repo, node in query_repositories(client, repos, fields, 2).items():
+        comparison = (node["base"] or {}).get("compare") or {}
+        found[repo] = BranchComparison(
+            bool(node["base"]), bool(node["head"]), comparison.get("aheadBy")
+        )
+    return found
+
+
+def find_issue_targets(
+    client: GraphqlClient, repos: list[str], labels: list[str]
+) -> dict[str, IssueTarget]:
+    """Read what creating an issue needs in many repositories.
+
+    Args:
+        client: GraphQL client.
+        repos: repository full names.
+        labels: label names of the issue.
+
+    Returns:
+        dict[str, IssueTarget]: issue target by repository.
+    """
+    label_fields = " ".join(
+        f"l{index}: label(name: {literal(label)}) {{ id }}"
+        for index, label in enumerate(labels)
+    )
+    fields = f"id hasIssuesEnabled {label_fields}"
+    found = {}
+    nodes = query_repositories(client, repos, fields, 1 + len(labels))
+    for repo, node in nodes.items():
+        label_ids = {
+            label: node[f"l{index}"]["id"]
+            for index, label in enumerate(labels)
+            if node.get(f"l{index}")
+        }
+        found[repo] = IssueTarget(node["id"], node["hasIssuesEnabled"], label_ids)
+    return found
+
+
+def create_issue(
+    repository_id: str, title: str, body: str, label_ids: list[str]
+) -> str:
+    """Return mutation creating an issue."""
+    labels = ", ".join(literal(label_id) for label_id in label_ids)
+    return (
+        f"createIssue(input: {{repositoryId: {literal(repository_id)}, "
+        f"title: {literal(title)}, body: {literal(body)}, labelIds: [{labels}]}}) "
+        "{ issue { number } }"
+    )
+
+
+def close_issue(node_id: str, pull_request: bool) -> str:
+    """Return mutation closing an issue or pull request."""
+    if pull_request:
+        return (
+            f"closePullRequest(input: {{pullRequestId: {literal(node_id)}}}) "
+            "{ clientMutationId }"
+        )
+    return f"closeIssue(input: {{issueId: {literal(node_id)}}}) {{ clientMutationId }}"
+
+
+def reopen_issue(node_id: str, pull_request: bool) -> str:
+    """Return mutation reopening an issue or pull request."""
+    if pull_request:
+        return (
+            f"reopenPullRequest(input: {{pullRequestId: {literal(node_id)}}}) "
+            "{ clientMutationId }"
+        )
+    return f"reopenIssue(input: {{issueId: {literal(node_id)}}}) {{ clientMutationId }}"
+
+
+def delete_ref(ref_id: str) -> str:
+    """Return mutation deleting a branch."""
+    return f"deleteRef(input: {{refId: {literal(ref_id)}}}) {{ clientMutationId }}"
+
+
+def run_mutations(
+    client: GraphqlClient,
+    mutations: list[tuple[str, str]],
+    max_retries: int = MUTATION_RETRIES,
+    retry_wait: float = rl.SECONDARY_LIMIT_WAIT,
+) -> dict[str, str | None]:
+    """Run many mutations with aliased documents.
+
+    Mutations GitHub rate limits are sent again in a later document, after a
+    wait doubling on each attempt.
+
+    Args:
+        client: GraphQL client.
+        mutations: key and mutation pairs, a key can have many mutations.
+        max_retries: times rate limited mutations are sent again.
+        retry_wait: seconds waited before the first retry.
+
+    Raises:
+        GraphqlUnavailableError: when the server lacks the mutations used, before
+            any of them ran.
+
+    Returns:
+        dict[str, str | None]: first error message by key, None when all of its
+            mutations succeeded.
+    """
+    outcomes: dict[str, str | None] = {}
+    pending = mutations
+    ran = False
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(retry_wait * 2 ** (attempt - 1))
+        limited = []
+        for chunk in chunks(pending, MAX_MUTATIONS_PER_DOCUMENT):
+            errors = _run_document(client, chunk, ran)
+            ran = True
+            for index, (key, mutation) in enumerate(chunk):
+                error = errors.get(f"m{index}")
+                if (
+                    error is not None
+                    and rl.is_rate_limit_message(error)
+                    and attempt < max_retries
+                ):
+                    limited.append((key, mutation))
+                elif outcomes.get(key) is None:
+                    outcomes[key] = error
+        if not limited:
+            break
+        pending = limited
+    return outcomes
+
+
+def _run_document(
+    client: GraphqlClient, chunk: list[tuple[str, str]], ran: bool
+) -> dict[str, str]:
+    """Run one aliased mutation document, returning error message by alias."""
+    selections = " ".join(
+        f"m{index}: {mutation}" for index, (_, mutation) in enumerate(chunk)
+    )
+    try:
+        _, errors = client.execute(f"mutation {{ {selections} }}")
+    except GraphqlError as error:
+        # once documents ran, the remaining ones cannot go to REST
+        if isinstance(error, GraphqlUnavailableError) and not ran:
+            raise
+        errors = {f"m{index}": str(error) for index in range(len(chunk))}
+    return errors
@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import copy
+import threading
 from typing import Any
+from typing import Callable
+from typing import TypeVar
+from typing import cast
 
 import github3
 
@@ -11,9 +16,17 @@ import git_portfolio.domain.gh_connection_settings as cs
 import git_portfolio.domain.issue as i
 import git_portfolio.domain.pull_request as pr
 import git_portfolio.domain.pull_request_merge as prm
+import git_portfolio.github_graphql as gq
+import git_portfolio.http_cache as hc
+import git_portfolio.rate_limiter as rl
 import git_portfolio.request_objects.issue_list as il
 
 
+# number of repositories fetched at the same time when resolving selected ones
+RESOLVE_JOBS = 8
+T = TypeVar("T")
+
+
 class GithubServiceError(Exception):
     """Generic error for GithubService."""
 
@@ -32,6 +45,52 @@ class AbstractGithubService(abc.ABC):
         """Return list of issues from one repository."""
         raise NotImplementedError  # pragma: no cover
 
+    def create_issue_from_repos(
+        self, github_repos: list[str], issue: i.Issue
+    ) -> dict[str, str | GithubServiceError]:
+        """Create issue in many repositories with few requests.
+
+        Returns:
+            dict[str, str | GithubServiceError]: output or error by repository,
+                missing for repositories to handle one at a time.
+        """
+        return {}
+
+    def close_issues_from_repos(
+        self, repo_issues: dict[str, list[i.Issue]]
+    ) -> dict[str, str | GithubServiceError]:
+        """Close issues of many repositories with few requests."""
+        return {}
+
+    def reopen_issues_from_repos(
+        self, repo_issues: dict[str, list[i.Issue]]
+    ) -> dict[str, str | GithubServiceError]:
+        """Reopen issues of many repositories with few requests."""
+        return {}
+
+    def delete_branch_from_repos(
+        self, github_repos: list[str], branch: str
+    ) -> dict[str, str | GithubServiceError]:
+        """Delete a branch from many repositories with few requests."""
+        return {}
+
+    def preflight_pull_requests(
+        self, github_repos: list[str], base: str, head: str
+    ) -> dict[str, str]:
+        """Find repositories where a pull request cannot be created.
+
+        Returns:
+            dict[str, str]: reason by repository, missing for repositories that
+                look viable or could not be checked.
+        """
+        return {}
+
+    def preflight_merges(
+        self, github_repos: list[str], pr_merge: prm.PullRequestMerge
+    ) -> dict[str, str]:
+        """Find repositories without a pull request to merge."""
+        return {}
+
     @staticmethod
     @abc.abstractmethod
     def link_issues(
@@ -44,27 +103,82 @@ class AbstractGithubService(abc.ABC):
 class GithubService(AbstractGithubService):
     """Github service class."""
 
-    def __init__(self, github_config: cs.GhConnectionSettings) -> None:
-        """Constructor."""
+    def __init__(
+        self,
+        github_config: cs.GhConnectionSettings,
+        selected_repos: list[str] | None = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            github_config: connection settings.
+            selected_repos: repositories the service works on. When given, only
+                those are fetched instead of listing every repository of the account.
+        """
         self.config = github_config
-        self.connection = self._get_connection()
-        self.user = self._test_connection(self.connection)
-        self.repos = self.connection.repositories()
+        self.selected_repos = selected_repos
+        # shared by all workers using this service
+        self.rate_limiter = rl.RateLimiter()
+        # connection, user and repositories are only fetched on first use
+        self._connection: github3.GitHub | github3.GitHubEnterprise | None = None
+        self._user: github3.users.AuthenticatedUser | None = None
+        self._connection_error: GithubServiceError | None = None
+        self._connection_lock = threading.Lock()
+        self._repos: dict[str, github3.repos.ShortRepository] | None = None
+        self._repos_lock = threading.Lock()
+        # selected repositories that could not be fetched, eg. forbidden ones
+        self._repo_errors: dict[str, GithubServiceError] = {}
+        # turned off when the server lacks the GraphQL schema used
+        self._graphql_available = True
+        # listed issues by repository and number, for GraphQL mutations
+        self._listed_issues: dict[tuple[str, int], gq.ListedIssue] = {}
+        # results shared between the warm-up thread and the command, kept for
+        # the lifetime of the service: a service runs a single command, which
+        # reads before it changes anything, so cached reads are never refreshed
+        self._fetched: dict[tuple[str, ...], concurrent.futures.Future[Any]] = {}
+        self._fetched_lock = threading.Lock()
+
+    @property
+    def connection(self) -> github3.GitHub | github3.GitHubEnterprise:
+        """Github connection, tested on first use."""
+        return self._get_connection()
+
+    @property
+    def user(self) -> github3.users.AuthenticatedUser:
+        """Authenticated user, cached for the lifetime of the service."""
+        self._get_connection()
+        return self._user
 
     def _get_connection(self) -> github3.GitHub | github3.GitHubEnterprise:
-        """Get Github connection, create one if does not exist."""
-        if hasattr(self, "connection"):
-            return self.connection
-
+        """Get Github connection, create and test one if does not exist."""
+        with self._connection_lock:
+            # a failed test is not retried for every repository
+            if self._connection_error is not None:
+                raise self._connection_error
+            if self._connection is None:
+                connection = self._login()
+                try:
+                    self._user = self._test_connection(connection)
+                except GithubServiceError as gse:
+                    self._connection_error = gse
+                    raise
+                self._connection = connection
+            return self._connection
+
+    def _login(self) -> github3.GitHub | github3.GitHubEnterprise:
+        """Create Github connection."""
         # GitHub Enterprise
         if self.config.hostname:
             base_url = f"https://{self.config.hostname}/api/v3"
-            return github3.enterprise_login(
+            connection = github3.enterprise_login(
                 url=base_url, token=self.config.access_token
             )
         # GitHub.com
         else:
-            return github3.login(token=self.config.access_token)
+            connection = github3.login(token=self.config.access_token)
+        # replays validators so unchanged resources answer 304
+        hc.mount(connection.session, limiter=self.rate_limiter)
+        return connection
 
     @staticmethod
     def _test_connection(
@@ -87,11 +201,202 @@ class GithubService(AbstractGithubService):
                 "Invalid response. Your token might not be properly scoped."
             ) from None
 
+    def _get_repos(self) -> dict[str, github3.repos.ShortRepository]:
+        """Get repositories indexed by full name, fetching them only once."""
+        with self._repos_lock:
+            if self._repos is None:
+                if self.selected_repos is None:
+                    self._repos = self._list_repos()
+                else:
+                    self._repos = self._resolve_repos(self.selected_repos)
+            return self._repos
+
+    def _list_repos(self) -> dict[str, github3.repos.ShortRepository]:
+        """List all repositories the token can see."""
+        return {repo.full_name: repo for repo in self.connection.repositories()}
+
+    def _resolve_repos(
+        self, repo_names: list[str]
+    ) -> dict[str, github3.repos.ShortRepository]:
+        """Fetch repositories directly by owner and name, skipping missing ones."""
+
+        def resolve(repo_name: str) -> github3.repos.ShortRepository | None:
+            try:
+                return self.connection.repository(*repo_name.split("/"))
+            except github3.exceptions.GitHubError as github_error:
+                # an inaccessible repository only fails its own lookups
+                self._repo_errors[repo_name] = GithubServiceError(
+                    f"{repo_name}: {github_error.msg}\n"
+                )
+                return None
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=RESOLVE_JOBS
+        ) as executor:
+            repos = executor.map(resolve, repo_names)
+            return {
+                repo_name: repo
+                for repo_name, repo in zip(repo_names, repos)
+                if repo is not None
+            }
+
     def _get_repo(self, repo_name: str) -> github3.repos.ShortRepository:
-        for repo in self.repos:
-            if repo.full_name == repo_name:
-                return repo
-        raise NameError(f"Repository {repo_name} not found.") from None
+        try:
+            return self._get_repos()[repo_name]
+        except KeyError:
+            if repo_name in self._repo_errors:
+                raise self._repo_errors[repo_name] from None
+            raise NameError(f"Repository {repo_name} not found.") from None
+
+    def _fetch_once(self, key: tuple[str, ...], fetch: Callable[[], T]) -> T:
+        """Run fetch once per key, other callers wait for and share its result."""
+        with self._fetched_lock:
+            future = self._fetched.get(key)
+            owner = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._fetched[key] = future
+        if owner:
+            try:
+                future.set_result(fetch())
+            except Exception as exc:
+                future.set_exception(exc)
+                # failures are not cached, next caller tries again
+                with self._fetched_lock:
+                    del self._fetched[key]
+        return cast(T, future.result())
+
+    def warm_up(self, issue_states: tuple[str, ...] = ()) -> threading.Thread:
+        """Fetch in background what a command is about to use.
+
+        Meant to be called before prompting the user, so the connection and the
+        issues with the given states are ready when the batch starts. Errors are
+        ignored here and raised again on actual use.
+
+        Args:
+            issue_states: states of the issues listed for each selected repository.
+
+        Returns:
+            threading.Thread: warm-up thread.
+        """
+        thread = threading.Thread(
+            target=self._warm_up, args=(issue_states,), daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _warm_up(self, issue_states: tuple[str, ...]) -> None:
+        """Fetch connection and issues of selected repositories.
+
+        Repositories are not resolved first: GraphQL reads and mutations do not
+        need them, and the REST fallback of the listing resolves them itself.
+        """
+        try:
+            self._get_connection()
+        except Exception:  # nosec
+            return
+        jobs = iter(
+            [
+                (github_repo, state)
+                for github_repo in self.selected_repos or []
+                for state in issue_states
+            ]
+        )
+        jobs_lock = threading.Lock()
+
+        def work() -> None:
+            while True:
+                with jobs_lock:
+                    job = next(jobs, None)
+                if job is None:
+                    return
+                try:
+                    self._list_repo_issues(*job)
+                except Exception:  # nosec
+                    continue
+
+        # daemon workers, unlike executor ones, do not hold the exit when the
+        # command ends before the warm-up
+        workers = [
+            threading.Thread(target=work, daemon=True) for _ in range(RESOLVE_JOBS)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def _graphql_read(
+        self,
+        key: tuple[str, ...],
+        github_repo: str,
+        read: Callable[[gq.GraphqlClient, list[str]], dict[str, T]],
+    ) -> T | None:
+        """Read data of a selected repository with one batch for all of them.
+
+        Args:
+            key: key of the batch shared by every selected repository.
+            github_repo: repository full name.
+            read: GraphQL read of many repositories.
+
+        Returns:
+            T | None: data of the repository or None when it must be read with REST.
+        """
+        if not self._graphql_available or github_repo not in (
+            self.selected_repos or []
+        ):
+            return None
+
+        def read_all() -> dict[str, T]:
+            client = self._graphql_client()
+            try:
+                return read(client, self.selected_repos or [])
+            except gq.GraphqlUnavailableError:
+                self._graphql_available = False
+            except gq.GraphqlError:
+                pass
+            # every repository of the batch falls back to REST
+            return {}
+
+        return self._fetch_once(("graphql", *key), read_all).get(github_repo)
+
+    def _graphql_client(self) -> gq.GraphqlClient:
+        """Return GraphQL client sharing the connection session."""
+        if self.config.hostname:
+            url = f"https://{self.config.hostname}/api/graphql"
+        else:
+            url = "https://api.github.com/graphql"
+        return gq.GraphqlClient(self.connection.session, url)
+
+    def _graphql_write(
+        self,
+        outcomes: dict[str, str | GithubServiceError],
+        mutations: list[tuple[str, str]],
+        success: str,
+    ) -> dict[str, str | GithubServiceError]:
+        """Run mutations of many repositories with aliased documents.
+
+        Args:
+            outcomes: outcomes of repositories already handled.
+            mutations: repository and mutation pairs.
+            success: output of repositories whose mutations all succeeded.
+
+        Returns:
+            dict[str, str | GithubServiceError]: outcomes, with the ones of
+                repositories of mutations unless GraphQL is unavailable.
+        """
+        if not mutations or not self._graphql_available:
+            return outcomes
+        try:
+            errors = gq.run_mutations(self._graphql_client(), mutations)
+        except gq.GraphqlUnavailableError:
+            self._graphql_available = False
+            return outcomes
+        for github_repo, error in errors.items():
+            if error is None:
+                outcomes[github_repo] = f"{github_repo}: {success}.\n"
+            else:
+                outcomes[github_repo] = GithubServiceError(f"{github_repo}: {error}\n")
+        return outcomes
 
     def get_config(self) -> cs.GhConnectionSettings:
         """Get service config."""
@@ -99,15 +404,16 @@ class GithubService(AbstractGithubService):
 
     def get_repo_names(self) -> list[str]:
         """Get list of repository names."""
-        return [repo.full_name for repo in self.repos]
+        if self.selected_repos is None:
+            return list(self._get_repos())
+        # choosing repositories needs the whole list, not only the selected ones
+        return list(self._list_repos())
 
     def get_repo_url(self, repo_name: str) -> str:
         """Get URL for repo."""
-        for repo in self.repos:
-            if repo.full_name == repo_name:
-                host = self.config.hostname if self.config.hostname else "github.com"
-                return f"git@{host}:{repo.full_name}.git"
-        raise NameError(f"Repository {repo_name} not found.")
+        repo = self._get_repo(repo_name)
+        host = self.config.hostname if self.config.hostname else "github.com"
+        return f"git@{host}:{repo.full_name}.git"
 
     def get_username(self) -> Any:
         """Get Github username."""
@@ -131,83 +437,213 @@ class GithubService(AbstractGithubService):
                 f"{github_repo}: {github_error.msg}\n"
             ) from github_error
 
+    def create_issue_from_repos(
+        self, github_repos: list[str], issue: i.Issue
+    ) -> dict[str, str | GithubServiceError]:
+        """Create issue in selected repositories with GraphQL mutations."""
+        labels = sorted(issue.labels)
+        outcomes: dict[str, str | GithubServiceError] = {}
+        mutations = []
+        for github_repo in github_repos:
+            target = self._graphql_read(
+                ("issue-target", *labels),
+                github_repo,
+                lambda client, repos: gq.find_issue_targets(client, repos, labels),
+            )
+            # only REST creates missing labels
+            if target is None or len(target.label_ids) < len(labels):
+                continue
+            if not target.has_issues:
+                outcomes[github_repo] = (
+                    f"{github_repo}: Issues are disabled for this repo. "
+                    "It may be a fork.\n"
+                )
+                continue
+            mutation = gq.create_issue(
+                target.node_id,
+                issue.title,
+                issue.body,
+                [target.label_ids[label] for label in labels],
+            )
+            mutations.append((github_repo, mutation))
+        return self._graphql_write(outcomes, mutations, "create issue successful")
+
     def list_issues_from_repo(
         self,
         github_repo: str,
         request: il.IssueListValidRequest,
     ) -> list[i.Issue]:
         """Return list of issues from one repository."""
-        repo = self._get_repo(github_repo)
-
-        domain_issues = []
         if not request.filters:
-            issues = list(repo.issues())
-            for issue in issues:
-                labels = {label.name for label in issue.labels()}
-                domain_issues.append(
-                    i.Issue(issue.number, issue.title, issue.body, labels)
-                )
-            return issues
+            issues = self._list_repo_issues(github_repo, None)
+            return [self._to_domain_issue(github_repo, issue) for issue in issues]
 
         obj = request.filters.get("obj__eq")
         state = request.filters.get("state__eq")
         title_query = request.filters.get("title__contains")
-        issues = list(repo.issues(state=state))
+        issues = self._list_repo_issues(github_repo, state)
 
         if obj == "issue":
-            issues = [issue for issue in issues if issue.pull_request_urls is None]
+            issues = [issue for issue in issues if not issue.pull_request]
         elif obj == "pull request":
-            issues = [issue for issue in issues if issue.pull_request_urls]
+            issues = [issue for issue in issues if issue.pull_request]
 
+        # titles are matched here rather than by the Search API, whose phrase
+        # queries match whole words and miss issues not indexed yet
         if title_query:
             issues = [issue for issue in issues if title_query in issue.title]
 
-        for issue in issues:
-            labels = {label.name for label in issue.labels()}
-            domain_issues.append(i.Issue(issue.number, issue.title, issue.body, labels))
+        return [self._to_domain_issue(github_repo, issue) for issue in issues]
 
-        return domain_issues
+    @staticmethod
+    def _to_listed_issue(issue: github3.issues.ShortIssue) -> gq.ListedIssue:
+        """Return listed issue with labels from the listing payload."""
+        # issue.labels() would cost one request per issue
+        labels = {label.name for label in issue.original_labels or []}
+        return gq.ListedIssue(
+            issue.number,
+            issue.title,
+            issue.body,
+            labels,
+            bool(issue.pull_request_urls),
+            str(issue.as_dict().get("node_id", "")),
+            str(issue.state),
+        )
+
+    def _to_domain_issue(self, github_repo: str, issue: gq.ListedIssue) -> i.Issue:
+        """Return domain issue from listed issue, keeping its node for mutations."""
+        self._listed_issues[(github_repo, issue.number)] = issue
+        return i.Issue(issue.number, issue.title, issue.body, issue.labels)
+
+    def _list_repo_issues(
+        self, github_repo: str, state: str | None
+    ) -> list[gq.ListedIssue]:
+        """List issues and pull requests of one repository with given state."""
+        listed = self._graphql_read(
+            ("issues", state or ""),
+            github_repo,
+            lambda client, repos: gq.list_issues(client, repos, state),
+        )
+        if listed is not None:
+            return listed
+        return self._fetch_once(
+            ("issues", github_repo, state or ""),
+            lambda: [
+                self._to_listed_issue(issue)
+                for issue in self._get_repo(github_repo).issues(state=state)
+            ],
+        )
 
     def close_issues_from_repo(
         self, github_repo: str, domain_issues: list[i.Issue]
     ) -> str:
         """Close issues from one repository."""
-        connection = self._get_connection()
-        repo_suffix = github_repo.split("/")[1]
-
         if not domain_issues:
             return f"{github_repo}: no issues match.\n"
 
         for domain_issue in domain_issues:
-            issue = connection.issue(
-                self.get_username(), repo_suffix, domain_issue.number
-            )
-            if not issue.is_closed():
-                issue.close()
+            response = self._set_issue_state(github_repo, domain_issue, "closed")
+            if response is not None and response.status_code != 200:
+                raise GithubServiceError(
+                    f"{github_repo}: {self._error_message(response)}\n"
+                )
         return f"{github_repo}: close issues successful.\n"
 
     def reopen_issues_from_repo(
         self, github_repo: str, domain_issues: list[i.Issue]
     ) -> str:
         """Reopen issues from one repository."""
-        connection = self._get_connection()
-        repo_suffix = github_repo.split("/")[1]
-
         if not domain_issues:
             return f"{github_repo}: no issues match.\n"
 
         for domain_issue in domain_issues:
-            issue = connection.issue(
-                self.get_username(), repo_suffix, domain_issue.number
-            )
-            try:
-                issue.reopen()
-            except github3.exceptions.UnprocessableEntity as ue:
+            response = self._set_issue_state(github_repo, domain_issue, "open")
+            if response is None or response.status_code == 200:
+                continue
+            message = self._error_message(response)
+            if response.status_code == 422:
                 raise GithubServiceError(
-                    f"{github_repo}: {ue.msg}. Probably the branch was deleted.\n"
-                ) from ue
+                    f"{github_repo}: {message}. Probably the branch was deleted.\n"
+                )
+            raise GithubServiceError(f"{github_repo}: {message}\n")
         return f"{github_repo}: reopen issues successful.\n"
 
+    def _set_issue_state(
+        self, github_repo: str, domain_issue: i.Issue, state: str
+    ) -> Any:
+        """Change state of an issue with one request.
+
+        The repository full name gives the owner, so the issue is not fetched
+        again after being listed.
+
+        Args:
+            github_repo: repository full name.
+            domain_issue: issue listed from the repository.
+            state: "open" or "closed".
+
+        Returns:
+            Any: response, None when the listing shows the issue has the state.
+        """
+        listed = self._listed_issues.get((github_repo, domain_issue.number))
+        if listed is not None and listed.state == state:
+            return None
+        response = self.connection.session.patch(
+            self._api_url(github_repo, "issues", str(domain_issue.number)),
+            json={"state": state},
+        )
+        if listed is not None and response.status_code == 200:
+            listed.state = state
+        return response
+
+    def close_issues_from_repos(
+        self, repo_issues: dict[str, list[i.Issue]]
+    ) -> dict[str, str | GithubServiceError]:
+        """Close listed issues of many repositories with GraphQL mutations."""
+        return self._set_issues_state(
+            repo_issues, gq.close_issue, "closed", "close issues successful"
+        )
+
+    def reopen_issues_from_repos(
+        self, repo_issues: dict[str, list[i.Issue]]
+    ) -> dict[str, str | GithubServiceError]:
+        """Reopen listed issues of many repositories with GraphQL mutations."""
+        return self._set_issues_state(
+            repo_issues, gq.reopen_issue, "open", "reopen issues successful"
+        )
+
+    def _set_issues_state(
+        self,
+        repo_issues: dict[str, list[i.Issue]],
+        mutation: Callable[[str, bool], str],
+        state: str,
+        success: str,
+    ) -> dict[str, str | GithubServiceError]:
+        """Run a state mutation on listed issues of many repositories."""
+        outcomes: dict[str, str | GithubServiceError] = {}
+        mutations: list[tuple[str, str]] = []
+        changed: list[gq.ListedIssue] = []
+        for github_repo, domain_issues in repo_issues.items():
+            if not domain_issues:
+                outcomes[github_repo] = f"{github_repo}: no issues match.\n"
+                continue
+            listed = [
+                self._listed_issues.get((github_repo, domain_issue.number))
+                for domain_issue in domain_issues
+            ]
+            # issues listed without node ids are handled with REST
+            if all(issue is not None and issue.node_id for issue in listed):
+                for issue in filter(None, listed):
+                    mutations.append(
+                        (github_repo, mutation(issue.node_id, issue.pull_request))
+                    )
+                    changed.append(issue)
+        outcomes = self._graphql_write(outcomes, mutations, success)
+        # listings are not read again, so they keep the new states
+        for (github_repo, _), issue in zip(mutations, changed):
+            if isinstance(outcomes.get(github_repo), str):
+                issue.state = state
+        return outcomes
+
     def create_pull_request_from_repo(
         self, github_repo: str, pr: pr.PullRequest
     ) -> str:
@@ -224,8 +660,17 @@ class GithubService(AbstractGithubService):
                 # draft=pr.draft,
             )
             if pr.labels:
-                issue = created_pr.issue()
-                issue.add_labels(*pr.labels)
+                # labels go straight to the issue of the new number, without
+                # fetching the issue first
+                number = str(created_pr.number)
+                response = self.connection.session.post(
+                    self._api_url(github_repo, "issues", number, "labels"),
+                    json={"labels": sorted(pr.labels)},
+                )
+                if response.status_code != 200:
+                    raise GithubServiceError(
+                        f"{github_repo}: {self._error_message(response)}\n"
+                    )
             return f"{github_repo}: create PR successful.\n"
         except github3.exceptions.UnprocessableEntity as github_exception:
             extra = ""
@@ -257,8 +702,45 @@ class GithubService(AbstractGithubService):
         pr.labels = labels
         return pr
 
+    def _find_branch(self, github_repo: str, branch: str) -> gq.BranchRef | None:
+        """Look a branch up in selected repositories with one GraphQL batch."""
+        return self._graphql_read(
+            ("branch", branch),
+            github_repo,
+            lambda client, repos: gq.find_branches(client, repos, branch),
+        )
+
+    def delete_branch_from_repos(
+        self, github_repos: list[str], branch: str
+    ) -> dict[str, str | GithubServiceError]:
+        """Delete a branch from selected repositories with GraphQL mutations."""
+        outcomes: dict[str, str | GithubServiceError] = {}
+        mutations = []
+        for github_repo in github_repos:
+            branch_ref = self._find_branch(github_repo, branch)
+            if branch_ref is None:
+                continue
+            if branch_ref.exists:
+                mutations.append((github_repo, gq.delete_ref(branch_ref.node_id)))
+            else:
+                outcomes[github_repo] = f"{github_repo}: Not Found.\n"
+        return self._graphql_write(outcomes, mutations, "delete branch successful")
+
     def delete_branch_from_repo(self, github_repo: str, branch: str) -> str:
         """Delete a branch from one repository."""
+        branch_ref = self._find_branch(github_repo, branch)
+        if branch_ref is not None:
+            if not branch_ref.exists:
+                return f"{github_repo}: Not Found.\n"
+            response = self.connection.session.delete(
+                self._api_url(github_repo, "git", "refs", "heads", branch)
+            )
+            if response.status_code == 204:
+                return f"{github_repo}: delete branch successful.\n"
+            raise GithubServiceError(
+                f"{github_repo}: {self._error_message(response)}\n"
+            )
+
         repo = self._get_repo(github_repo)
         try:
             branch_ref = repo.ref(f"heads/{branch}")
@@ -271,10 +753,62 @@ class GithubService(AbstractGithubService):
                 f"{github_repo}: {github_error.msg}\n"
             ) from github_error
 
+    def preflight_pull_requests(
+        self, github_repos: list[str], base: str, head: str
+    ) -> dict[str, str]:
+        """Compare branches of selected repositories with one GraphQL batch."""
+        reasons = {}
+        for github_repo in github_repos:
+            comparison = self._graphql_read(
+                ("compare", base, head),
+                github_repo,
+                lambda client, repos: gq.compare_branches(client, repos, base, head),
+            )
+            if comparison is None:
+                continue
+            if not comparison.base_exists:
+                reasons[github_repo] = f"{github_repo}: base branch {base} not found.\n"
+            elif not comparison.head_exists:
+                reasons[github_repo] = f"{github_repo}: head branch {head} not found.\n"
+            elif comparison.ahead_by == 0:
+                reasons[github_repo] = (
+                    f"{github_repo}: No commits between {base} and {head}.\n"
+                )
+        return reasons
+
+    def _find_pull_requests(
+        self, github_repo: str, pr_merge: prm.PullRequestMerge
+    ) -> list[gq.PullRequestRef] | None:
+        """Find pull requests of selected repositories with one GraphQL batch."""
+        return self._graphql_read(
+            ("pulls", pr_merge.base, pr_merge.head, pr_merge.prefix),
+            github_repo,
+            lambda client, repos: gq.list_pull_requests(
+                client, repos, pr_merge.base, pr_merge.head, pr_merge.prefix
+            ),
+        )
+
+    def preflight_merges(
+        self, github_repos: list[str], pr_merge: prm.PullRequestMerge
+    ) -> dict[str, str]:
+        """Find selected repositories without a pull request to merge."""
+        return {
+            github_repo: (
+                f"{github_repo}: no open PR found for "
+                f"{pr_merge.base}:{pr_merge.head}.\n"
+            )
+            for github_repo in github_repos
+            if self._find_pull_requests(github_repo, pr_merge) == []
+        }
+
     def merge_pull_request_from_repo(
         self, github_repo: str, pr_merge: prm.PullRequestMerge
     ) -> str:
         """Merge pull request from one repository."""
+        pull_refs = self._find_pull_requests(github_repo, pr_merge)
+        if pull_refs is not None:
+            return self._merge_pull_request_ref(github_repo, pr_merge, pull_refs)
+
         repo = self._get_repo(github_repo)
 
         # Important note: base and head arguments have different import formats.
@@ -303,3 +837,44 @@ class GithubService(AbstractGithubService):
                 f"{github_repo}: unexpected number of PRs for "
                 f"{pr_merge.base}:{pr_merge.head}.\n"
             )
+
+    def _merge_pull_request_ref(
+        self,
+        github_repo: str,
+        pr_merge: prm.PullRequestMerge,
+        pull_refs: list[gq.PullRequestRef],
+    ) -> str:
+        """Merge the only pull request found by GraphQL."""
+        if not pull_refs:
+            raise GithubServiceError(
+                f"{github_repo}: no open PR found for "
+                f"{pr_merge.base}:{pr_merge.head}.\n"
+            )
+        if len(pull_refs) > 1:
+            return (
+                f"{github_repo}: unexpected number of PRs for "
+                f"{pr_merge.base}:{pr_merge.head}.\n"
+            )
+        response = self.connection.session.put(
+            self._api_url(github_repo, "pulls", str(pull_refs[0].number), "merge"),
+            json={},
+        )
+        if response.status_code != 200:
+            raise GithubServiceError(
+                f"{github_repo}: {self._error_message(response)}\n"
+            )
+        return f"{github_repo}: merge PR successful.\n"
+
+    def _api_url(self, github_repo: str, *parts: str) -> str:
+        """Return REST URL of a repository resource."""
+        return str(
+            self.connection.session.build_url("repos", *github_repo.split("/"), *parts)
+        )
+
+    @staticmethod
+    def _error_message(response: Any) -> str:
+        """Return error message of a REST response."""
+        try:
+            return str(response.json()["message"])
+        except (ValueError, TypeError, KeyError):
+            return f"HTTP {response.status_code}"
@@ -0,0 +1,246 @@
+"""HTTP conditional request cache module."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import pathlib
+import threading
+from typing import Any
+
+import requests
+
+import git_portfolio.rate_limiter as rl
+
+
+# default upper bound for the total size of cached responses in bytes
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+# bump when the format of cache entries changes
+CACHE_VERSION = 1
+# share of the max size left after evicting, so writes past the limit do not
+# scan the folder each time
+EVICT_RATIO = 0.9
+
+
+class HttpCache:
+    """Size bounded on-disk store of responses carrying validators."""
+
+    def __init__(
+        self, cache_folder: str = "", max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Constructor.
+
+        Args:
+            cache_folder: folder holding the entries. Defaults to `~/.gitp/cache`.
+            max_size: total size of entries in bytes kept after each write.
+        """
+        self.cache_folder = cache_folder or os.path.join(
+            os.path.expanduser("~"), ".gitp", "cache"
+        )
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # entry sizes by path and their total, read from disk on first write
+        self._sizes: dict[str, int] | None = None
+        self._total = 0
+
+    @staticmethod
+    def key(request: requests.PreparedRequest) -> str:
+        """Return cache key of a request.
+
+        Credentials are part of the key so entries are never shared across tokens.
+
+        Args:
+            request: prepared request.
+
+        Returns:
+            str: hexadecimal digest.
+        """
+        parts = [
+            str(CACHE_VERSION),
+            request.method or "",
+            request.url or "",
+            request.headers.get("Accept", ""),
+            request.headers.get("Authorization", ""),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Return path of the entry of a key."""
+        return os.path.join(self.cache_folder, f"{key}.json")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return entry of a key and mark it as recently used.
+
+        Args:
+            key: cache key.
+
+        Returns:
+            dict[str, Any] | None: entry or None when missing or unreadable.
+        """
+        path = self._path(key)
+        try:
+            with open(path) as entry_file:
+                entry: dict[str, Any] = json.load(entry_file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store entry of a key and evict least recently used ones over max size.
+
+        Args:
+            key: cache key.
+            entry: JSON serializable entry.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            pathlib.Path(self.cache_folder).mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as entry_file:
+                json.dump(entry, entry_file)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._sizes is None:
+                self._index(self._scan())
+            else:
+                self._total += size - self._sizes.get(path, 0)
+                self._sizes[path] = size
+            if self._total > self.max_size:
+                self._evict()
+
+    def _scan(self) -> list[tuple[int, int, str]]:
+        """Return last use, size and path of the entries on disk."""
+        entries = []
+        with os.scandir(self.cache_folder) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, dir_entry.path))
+        return entries
+
+    def _index(self, entries: list[tuple[int, int, str]]) -> None:
+        """Replace the entry sizes kept in memory."""
+        self._sizes = {path: size for _, size, path in entries}
+        self._total = sum(self._sizes.values())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until total size fits the ratio.
+
+        Entries are read again from disk, since other processes may share the
+        folder and reads only update the last use there.
+        """
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_size * EVICT_RATIO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+            evicted += 1
+        self._index(entries[evicted:])
+
+
+class CachingAdapter(rl.RateLimitAdapter):
+    """Transport adapter revalidating GET requests with ETag and Last-Modified.
+
+    A 304 answer is replaced by the stored response, so callers see the same
+    content without downloading it again. Requests, including revalidations,
+    are scheduled by the rate limiter of the base adapter.
+    """
+
+    def __init__(
+        self, cache: HttpCache, limiter: rl.RateLimiter | None = None, **kwargs: Any
+    ) -> None:
+        """Constructor.
+
+        Args:
+            cache: store of responses.
+            limiter: shared rate limit scheduler. Defaults to a new one.
+            kwargs: arguments of `requests.adapters.HTTPAdapter`.
+        """
+        super().__init__(limiter, **kwargs)
+        self.cache = cache
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send request, conditionally when a response for it is stored."""
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = self.cache.key(request)
+        entry = self.cache.get(key)
+        if entry:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry:
+            response.close()
+            return self._cached_response(response, entry)
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.cache.put(
+                    key,
+                    {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "headers": dict(response.headers),
+                        "content": base64.b64encode(response.content).decode(
+                            "ascii"
+                        ),
+                    },
+                )
+        return response
+
+    @staticmethod
+    def _cached_response(
+        not_modified: requests.Response, entry: dict[str, Any]
+    ) -> requests.Response:
+        """Build response from stored entry and headers of the 304 answer."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+        # fresh headers such as rate limits come with the 304 answer
+        response.headers.update(not_modified.headers)
+        # content was stored decoded
+        response.headers.pop("Content-Encoding", None)
+        response.headers.pop("Content-Length", None)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(entry["content"])
+        return response
+
+
+def mount(
+    session: requests.Session,
+    cache: HttpCache | None = None,
+    limiter: rl.RateLimiter | None = None,
+) -> None:
+    """Route HTTPS requests of a session through a caching adapter.
+
+    Args:
+        session: session used by the GitHub client.
+        cache: store of responses. Defaults to one at `~/.gitp/cache`.
+        limiter: shared rate limit scheduler. Defaults to a new one.
+    """
+    session.mount("https://", CachingAdapter(cache or HttpCache(), limiter))
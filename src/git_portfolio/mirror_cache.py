@@ -0,0 +1,55 @@
+"""Local mirror cache module."""
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess  # nosec
+
+
+class MirrorCache:
+    """Cache of bare repository mirrors used as reference for new clones."""
+
+    def __init__(self, cache_folder: str = "") -> None:
+        """Constructor.
+
+        Args:
+            cache_folder: folder holding the mirrors. Defaults to `~/.gitp/mirrors`.
+        """
+        self.cache_folder = cache_folder or os.path.join(
+            os.path.expanduser("~"), ".gitp", "mirrors"
+        )
+
+    def mirror_path(self, repo_name: str) -> str:
+        """Return path of the mirror of a repository.
+
+        Args:
+            repo_name: repository full name eg. org/repo.
+
+        Returns:
+            str: path of the bare mirror.
+        """
+        return os.path.join(self.cache_folder, f"{repo_name}.git")
+
+    def refresh(self, repo_name: str, clone_path: str) -> str:
+        """Create mirror of a repository or fetch what is new since last refresh.
+
+        Args:
+            repo_name: repository full name eg. org/repo.
+            clone_path: repository URL.
+
+        Returns:
+            str: error output, empty on success.
+        """
+        path = self.mirror_path(repo_name)
+        if os.path.isdir(path):
+            command = ["git", "--git-dir", path, "remote", "update", "--prune"]
+        else:
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+            command = ["git", "clone", "--mirror", clone_path, path]
+        popen = subprocess.Popen(  # nosec
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        _, error = popen.communicate()
+        if popen.returncode == 0:
+            return ""
+        return error.decode("utf-8")
@@ -0,0 +1,368 @@
+"""GitHub rate limit scheduler module."""
+from __future__ import annotations
+
+import contextlib
+import json
+import re
+import threading
+import time
+import urllib.parse
+from typing import Any
+from typing import Mapping
+
+import requests
+import requests.adapters
+
+
+# requests sent at once before pacing starts
+DEFAULT_BURST = 20
+# share of a quota left under which requests are spread until it resets
+LOW_QUOTA_RATIO = 0.1
+DEFAULT_MAX_RETRIES = 3
+# GitHub asks to wait a minute after a secondary limit without Retry-After
+SECONDARY_LIMIT_WAIT = 60.0
+# requests GitHub counts as content creation, sent one at a time
+MUTATION_METHODS = frozenset({"POST", "PATCH", "PUT", "DELETE"})
+# GitHub asks for at least one second between content-creating requests
+DEFAULT_MUTATION_SPACING = 1.0
+MAX_MUTATION_SPACING = 60.0
+STRING_LITERAL = re.compile(r'"(?:\\.|[^"\\])*"')
+
+
+class MutationLane:
+    """Schedule of content-creating requests, one at a time and spaced out.
+
+    Spacing doubles each time a mutation is rate limited and shrinks back to
+    the configured value as mutations succeed again.
+    """
+
+    def __init__(
+        self,
+        spacing: float = DEFAULT_MUTATION_SPACING,
+        max_spacing: float = MAX_MUTATION_SPACING,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            spacing: seconds between the start of two mutations.
+            max_spacing: upper bound of spacing after backoffs.
+        """
+        self.spacing = spacing
+        self.max_spacing = max_spacing
+        # held by blocking senders for the whole request
+        self.lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._current_spacing = spacing
+        self._next_start = 0.0
+
+    @property
+    def current_spacing(self) -> float:
+        """Seconds between mutations after backoffs."""
+        return self._current_spacing
+
+    def reserve(self, count: int = 1) -> float:
+        """Reserve the next mutation slots.
+
+        Args:
+            count: mutations sent by the request.
+
+        Returns:
+            float: seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._current_spacing * count
+            return start - now
+
+    def record(self, limited: bool) -> None:
+        """Adapt spacing to the outcome of a mutation.
+
+        Args:
+            limited: whether GitHub rate limited it.
+        """
+        with self._lock:
+            if limited:
+                self._current_spacing = min(
+                    max(self._current_spacing, self.spacing) * 2, self.max_spacing
+                )
+            else:
+                self._current_spacing = max(
+                    self.spacing, (self._current_spacing + self.spacing) / 2
+                )
+
+
+class _Bucket:
+    """Pace of the requests counted against one GitHub rate limit resource."""
+
+    def __init__(self, rate: float | None, burst: int) -> None:
+        # requests per second, None when the quota is not at risk
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+
+class RateLimiter:
+    """Token buckets shared by every request of a service.
+
+    GitHub counts requests in separate resources (core, search, graphql...),
+    each with its own quota, so every resource has its own bucket. Requests are
+    not paced while a quota is healthy; once less than `low_quota` of it is
+    left, they are spread so the rest lasts until it resets. Limited responses
+    pause the workers instead of failing.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        secondary_wait: float = SECONDARY_LIMIT_WAIT,
+        mutation_spacing: float = DEFAULT_MUTATION_SPACING,
+        low_quota: float = LOW_QUOTA_RATIO,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            rate: maximum requests per second of each resource. Defaults to no
+                cap other than the quotas announced by GitHub.
+            burst: requests allowed at once when paced.
+            max_retries: retries of a limited request before giving up.
+            secondary_wait: seconds paused after a secondary limit without
+                `Retry-After`.
+            mutation_spacing: seconds between content-creating requests.
+            low_quota: share of a quota left under which requests are paced.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.secondary_wait = secondary_wait
+        self.low_quota = low_quota
+        # reads run in parallel within the bucket, mutations also take this lane
+        self.mutations = MutationLane(mutation_spacing)
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        # secondary limits hold every resource
+        self._paused_until = 0.0
+
+    def _bucket(self, resource: str) -> _Bucket:
+        """Return bucket of a resource. Caller holds the lock."""
+        if resource not in self._buckets:
+            self._buckets[resource] = _Bucket(self.rate, self.burst)
+        return self._buckets[resource]
+
+    def acquire(self, resource: str = "core") -> float:
+        """Reserve a token for one request.
+
+        Args:
+            resource: rate limit resource the request counts against.
+
+        Returns:
+            float: seconds to wait before sending it.
+        """
+        with self._lock:
+            bucket = self._bucket(resource)
+            now = time.monotonic()
+            wait = max(self._paused_until, bucket.paused_until) - now
+            if bucket.rate is None:
+                bucket.tokens = float(self.burst)
+            else:
+                bucket.tokens = min(
+                    self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate
+                )
+                bucket.tokens -= 1
+                if bucket.tokens < 0:
+                    wait = max(wait, -bucket.tokens / bucket.rate)
+            bucket.updated = now
+            return max(wait, 0.0)
+
+    def update(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        message: str = "",
+        resource: str = "core",
+    ) -> float | None:
+        """Adjust pace from a response.
+
+        Args:
+            status: HTTP status code.
+            headers: response headers.
+            message: error message of the response body.
+            resource: resource of the request, unless the response names it.
+
+        Returns:
+            float | None: seconds workers are paused when the request was rate
+                limited and should be sent again, otherwise None.
+        """
+        lower_headers = {name.lower(): value for name, value in headers.items()}
+        resource = lower_headers.get("x-ratelimit-resource", resource)
+        limit = _to_float(lower_headers.get("x-ratelimit-limit"))
+        remaining = _to_float(lower_headers.get("x-ratelimit-remaining"))
+        reset = _to_float(lower_headers.get("x-ratelimit-reset"))
+        retry_after = _to_float(lower_headers.get("retry-after"))
+        until_reset = max(reset - time.time(), 0.0) if reset is not None else None
+
+        delay = None
+        if status in (403, 429):
+            if retry_after is not None:
+                delay = retry_after
+            elif remaining == 0 and until_reset is not None:
+                delay = until_reset
+            elif status == 429 or is_rate_limit_message(message):
+                delay = self.secondary_wait
+
+        with self._lock:
+            bucket = self._bucket(resource)
+            now = time.monotonic()
+            if remaining is not None and until_reset is not None:
+                if remaining == 0:
+                    bucket.paused_until = max(bucket.paused_until, now + until_reset)
+                bucket.rate = self._pace(limit, remaining, until_reset)
+            if delay is not None and remaining != 0:
+                self._paused_until = max(self._paused_until, now + delay)
+        return delay
+
+    def _pace(
+        self, limit: float | None, remaining: float, until_reset: float
+    ) -> float | None:
+        """Return rate of a resource from its quota, None when unpaced."""
+        if limit is None or remaining >= limit * self.low_quota:
+            return self.rate
+        # spread the remaining quota until it resets
+        rate = max(remaining / max(until_reset, 1.0), 1 / 60)
+        return rate if self.rate is None else min(rate, self.rate)
+
+
+def _to_float(value: str | None) -> float | None:
+    """Return header value as a number, None when missing or invalid."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_rate_limit_message(message: str) -> bool:
+    """Return whether an error message tells a request was rate limited."""
+    lower_message = message.lower()
+    return "rate limit" in lower_message or "too quickly" in lower_message
+
+
+def mutation_cost(method: str | None, url: str | None, body: Any = None) -> int:
+    """Return how many content-creating operations a request makes.
+
+    GraphQL queries are reads sent with POST, a GraphQL mutation document makes
+    one operation per top level field.
+
+    Args:
+        method: HTTP method.
+        url: request URL.
+        body: request body.
+
+    Returns:
+        int: mutation lane slots the request takes, 0 for reads.
+    """
+    if method not in MUTATION_METHODS:
+        return 0
+    if method != "POST" or resource_of(url) != "graphql":
+        return 1
+    try:
+        query = str(json.loads(body or "{}").get("query", ""))
+    except (ValueError, AttributeError):
+        return 1
+    if query.lstrip().startswith(("query", "{")):
+        return 0
+    return max(1, _count_fields(query))
+
+
+def _count_fields(query: str) -> int:
+    """Return number of top level fields with a selection set in a document."""
+    count = braces = parentheses = 0
+    # braces inside string arguments are not part of the structure
+    for char in STRING_LITERAL.sub('""', query):
+        if char in "()":
+            parentheses += 1 if char == "(" else -1
+        elif char == "{":
+            if braces == 1 and parentheses == 0:
+                count += 1
+            braces += 1
+        elif char == "}":
+            braces -= 1
+    return count
+
+
+def is_mutation(method: str | None, url: str | None, body: Any = None) -> bool:
+    """Return whether a request creates content and must take the mutation lane."""
+    return mutation_cost(method, url, body) > 0
+
+
+def _graphql_rate_limited(response: requests.Response) -> bool:
+    """Return whether a GraphQL response has rate limited fields."""
+    try:
+        errors = response.json().get("errors") or []
+    except (ValueError, AttributeError):
+        return False
+    return any(
+        is_rate_limit_message(str(error.get("message", "")))
+        or error.get("type") == "RATE_LIMITED"
+        for error in errors
+        if isinstance(error, dict)
+    )
+
+
+def resource_of(url: str | None) -> str:
+    """Return GitHub rate limit resource a request URL counts against."""
+    path = urllib.parse.urlsplit(url or "").path.rstrip("/")
+    if path.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in f"{path}/":
+        return "search"
+    return "core"
+
+
+class RateLimitAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter scheduling requests with a `RateLimiter`."""
+
+    def __init__(self, limiter: RateLimiter | None = None, **kwargs: Any) -> None:
+        """Constructor.
+
+        Args:
+            limiter: shared scheduler. Defaults to a new one.
+            kwargs: arguments of `requests.adapters.HTTPAdapter`.
+        """
+        super().__init__(**kwargs)
+        self.limiter = limiter or RateLimiter()
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send request when the limiter allows it, again if it was limited."""
+        mutations = self.limiter.mutations
+        cost = mutation_cost(request.method, request.url, request.body)
+        resource = resource_of(request.url)
+        with mutations.lock if cost else contextlib.nullcontext():
+            attempt = 0
+            while True:
+                wait = self.limiter.acquire(resource)
+                if cost:
+                    # every mutation of a GraphQL document counts
+                    wait = max(wait, mutations.reserve(cost))
+                time.sleep(wait)
+                response = super().send(request, **kwargs)
+                message = ""
+                if response.status_code in (403, 429):
+                    message = response.text
+                delay = self.limiter.update(
+                    response.status_code, response.headers, message, resource
+                )
+                if cost:
+                    # GraphQL answers limited mutations with errors in a 200
+                    mutations.record(
+                        delay is not None
+                        or (resource == "graphql" and _graphql_rate_limited(response))
+                    )
+                if delay is None or attempt == self.limiter.max_retries:
+                    return response
+                response.close()
+                attempt += 1
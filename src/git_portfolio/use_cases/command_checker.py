@@ -1,5 +1,12 @@
 """Command checker use case."""
-import subprocess  # nosec
+from __future__ import annotations
+
+import os
+import shutil
+
+
+# executables already resolved by this process, keyed by command and PATH
+_RESOLVED: dict[tuple[str, str], str | None] = {}
 
 
 class CommandChecker:
@@ -8,18 +15,20 @@ class CommandChecker:
     def check(self, command: str) -> str:
         """Check installation of required commands.
 
+        The executable is looked up on system path without running it and the
+        result is cached for the lifetime of the process.
+
         Args:
             command: checked command.
 
         Returns:
             str: output message.
         """
-        try:
-            popen = subprocess.Popen(  # nosec
-                command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
-            )
-            popen.communicate()
-        except FileNotFoundError:
+        path = os.environ.get("PATH", os.defpath)
+        key = (command, path)
+        if key not in _RESOLVED:
+            _RESOLVED[key] = shutil.which(command, path=path)
+        if _RESOLVED[key] is None:
             return (
                 f"This command requires {command} executable installed and on "
                 "system path."
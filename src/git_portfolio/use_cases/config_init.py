@@ -18,16 +18,17 @@ class ConfigInitUseCase:
 
     def execute(self, request: gcs.GhConnectionSettings) -> res.Response:
         """Initialize app configuration."""
+        # connects on first use, so errors come from listing the repositories
+        new_github_service = ghs.GithubService(request)
         try:
-            new_github_service = ghs.GithubService(request)
-        except AttributeError as ae:
-            return res.ResponseFailure(res.ResponseTypes.PARAMETERS_ERROR, f"{ae}")
+            repo_names = new_github_service.get_repo_names()
+        except ghs.GithubServiceError as gse:
+            return res.ResponseFailure(res.ResponseTypes.PARAMETERS_ERROR, f"{gse}")
         except ConnectionError:
             return res.ResponseFailure(
                 res.ResponseTypes.SYSTEM_ERROR,
                 "impossible to connect, please check your hostname address and token.",
             )
-        repo_names = new_github_service.get_repo_names()
         config = new_github_service.get_config()
         selected_repos = p.InquirerPrompter.select_repos(repo_names)
         cr.ConfigReposUseCase(self.config_manager).execute(config, selected_repos)
@@ -1,12 +1,24 @@
 """Base Github use case."""
 from __future__ import annotations
 
+import concurrent.futures
+import threading
 import traceback
 from typing import Any
+from typing import Callable
+from typing import TypeVar
+from typing import cast
 
 import git_portfolio.config_manager as cm
 import git_portfolio.github_service as gs
+import git_portfolio.request_objects.issue_list as il
 import git_portfolio.responses as res
+import git_portfolio.views as views
+
+
+# GitHub calls are network bound, so more repositories than CPUs fit at a time
+DEFAULT_JOBS = 8
+T = TypeVar("T")
 
 
 class GhUseCase:
@@ -17,12 +29,34 @@ class GhUseCase:
         config_manager: cm.ConfigManager,
         github_service: gs.AbstractGithubService,
         github_repo: str = "",
+        jobs: int | None = None,
     ) -> None:
-        """Initializer."""
+        """Initializer.
+
+        Args:
+            config_manager: config manager.
+            github_service: Github service.
+            github_repo: single repository to act on. Defaults to all selected ones.
+            jobs: maximum number of repositories processed in parallel. Defaults to
+                `DEFAULT_JOBS`.
+        """
         self.config_manager = config_manager
         self.github_service = github_service
         self.github_repo = github_repo
+        self.jobs = jobs or DEFAULT_JOBS
         self.responses: list[res.Response] = []
+        self._local = threading.local()
+
+    @property
+    def responses(self) -> list[res.Response]:
+        """Responses of the running action, or of the whole execution."""
+        return cast(
+            list[res.Response], getattr(self._local, "responses", self._responses)
+        )
+
+    @responses.setter
+    def responses(self, responses: list[res.Response]) -> None:
+        self._responses = responses
 
     def call_github_service(
         self, method: str, *args: Any, **kwargs: Any
@@ -49,11 +83,117 @@ class GhUseCase:
         """Execute some action in a repo."""
         raise NotImplementedError  # pragma: no cover
 
+    def batch(
+        self, github_repos: list[str], *args: Any, **kwargs: Any
+    ) -> dict[str, list[res.Response]]:
+        """Execute the action in many repos with few requests.
+
+        Args:
+            github_repos: selected repositories.
+            args: arguments of the action.
+            kwargs: keyword arguments of the action.
+
+        Returns:
+            dict[str, list[res.Response]]: responses by repository, missing for
+                repositories left to `action`.
+        """
+        return {}
+
+    @staticmethod
+    def batch_responses(
+        outcomes: dict[str, str | gs.GithubServiceError]
+    ) -> dict[str, list[res.Response]]:
+        """Return responses of a github_service call on many repos."""
+        responses: dict[str, list[res.Response]] = {}
+        for github_repo, outcome in outcomes.items():
+            if isinstance(outcome, gs.GithubServiceError):
+                responses[github_repo] = [
+                    res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, str(outcome))
+                ]
+            else:
+                responses[github_repo] = [res.ResponseSuccess(outcome)]
+        return responses
+
+    def batch_issues(
+        self,
+        method: str,
+        github_repos: list[str],
+        request_object: il.IssueListValidRequest | il.IssueListInvalidRequest,
+    ) -> dict[str, list[res.Response]]:
+        """List matching issues of all repos and pass them to one service call.
+
+        Args:
+            method: github_service method taking issues by repository.
+            github_repos: selected repositories.
+            request_object: filters of the issues.
+
+        Returns:
+            dict[str, list[res.Response]]: responses by repository.
+        """
+        listings = self.map_repos(
+            lambda github_repo: views.issues(
+                github_repo, self.github_service, request_object
+            ),
+            github_repos,
+        )
+        repo_issues = {
+            github_repo: response.value
+            for github_repo, response in zip(github_repos, listings)
+            if isinstance(response, res.ResponseSuccess)
+        }
+        return self.batch_responses(getattr(self.github_service, method)(repo_issues))
+
+    @staticmethod
+    def failure_responses(reasons: dict[str, str]) -> dict[str, list[res.Response]]:
+        """Return responses of repos skipped for a reason."""
+        return {
+            github_repo: [res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, reason)]
+            for github_repo, reason in reasons.items()
+        }
+
+    def map_repos(
+        self, function: Callable[[str], T], github_repos: list[str]
+    ) -> list[T]:
+        """Call function for each repo in parallel, keeping their order."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            return list(executor.map(function, github_repos))
+
     def execute(self, *args: Any, **kwargs: Any) -> list[res.Response]:
         """Execute GitHubUseCase."""
         if self.github_repo:
             self.action(self.github_repo, *args, **kwargs)
-        else:
-            for github_repo in self.config_manager.config.github_selected_repos:
-                self.action(github_repo, *args, **kwargs)
+            return self.responses
+        return self.execute_repos(
+            self.config_manager.config.github_selected_repos, *args, **kwargs
+        )
+
+    def execute_repos(
+        self, github_repos: list[str], *args: Any, **kwargs: Any
+    ) -> list[res.Response]:
+        """Execute GitHubUseCase in some of the selected repos."""
+        try:
+            batched = self.batch(github_repos, *args, **kwargs)
+        except gs.GithubServiceError:
+            # action reports the error of each repository
+            batched = {}
+        remaining = [repo for repo in github_repos if repo not in batched]
+        responses = self.map_repos(
+            lambda github_repo: self._run_action(github_repo, *args, **kwargs),
+            remaining,
+        )
+        repo_responses = {**batched, **dict(zip(remaining, responses))}
+        # keeps the order of selected repositories
+        for github_repo in github_repos:
+            self.responses.extend(repo_responses[github_repo])
         return self.responses
+
+    def _run_action(
+        self, github_repo: str, *args: Any, **kwargs: Any
+    ) -> list[res.Response]:
+        """Execute action collecting its responses apart from other repos."""
+        self._local.responses = []
+        try:
+            self.action(github_repo, *args, **kwargs)
+            return self.responses
+        finally:
+            del self._local.responses
@@ -27,3 +27,13 @@ class GhCloseIssueUseCase(gh.GhUseCase):
                     f"{github_repo}: no issues match search.\n",
                 )
             )
+
+    def batch(
+        self,
+        github_repos: list[str],
+        request_object: il.IssueListValidRequest | il.IssueListInvalidRequest,
+    ) -> dict[str, list[res.Response]]:
+        """Close matching issues of all repos with batched mutations."""
+        return self.batch_issues(
+            "close_issues_from_repos", github_repos, request_object
+        )
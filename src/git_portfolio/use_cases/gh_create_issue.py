@@ -1,5 +1,6 @@
 """Create issue on Github use case."""
 import git_portfolio.domain.issue as i
+import git_portfolio.responses as res
 import git_portfolio.use_cases.gh as gh
 
 
@@ -12,3 +13,11 @@ class GhCreateIssueUseCase(gh.GhUseCase):
         """Create issues."""
         github_service_method = "create_issue_from_repo"
         self.call_github_service(github_service_method, github_repo, issue)
+
+    def batch(
+        self, github_repos: list[str], issue: i.Issue
+    ) -> dict[str, list[res.Response]]:
+        """Create issues with batched mutations."""
+        return self.batch_responses(
+            self.github_service.create_issue_from_repos(github_repos, issue)
+        )
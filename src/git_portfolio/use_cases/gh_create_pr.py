@@ -28,3 +28,19 @@ class GhCreatePrUseCase(gh.GhUseCase):
         except NameError:
             custom_pr = pr_obj
         self.call_github_service(github_service_method, github_repo, custom_pr)
+
+    def batch(
+        self,
+        github_repos: list[str],
+        pr_obj: pr.PullRequest,
+        request_object: il.IssueListValidRequest | il.IssueListInvalidRequest,
+    ) -> dict[str, list[res.Response]]:
+        """Report repos where the pull request cannot be created, skipping them."""
+        reasons = self.github_service.preflight_pull_requests(
+            github_repos, pr_obj.base, pr_obj.head
+        )
+        # reported as success, like the validation error GitHub gives them
+        return {
+            github_repo: [res.ResponseSuccess(reason)]
+            for github_repo, reason in reasons.items()
+        }
@@ -1,4 +1,5 @@
 """Delete branch on Github use case."""
+import git_portfolio.responses as res
 import git_portfolio.use_cases.gh as gh
 
 
@@ -9,3 +10,11 @@ class GhDeleteBranchUseCase(gh.GhUseCase):
         """Delete branches."""
         github_service_method = "delete_branch_from_repo"
         self.call_github_service(github_service_method, github_repo, branch)
+
+    def batch(
+        self, github_repos: list[str], branch: str
+    ) -> dict[str, list[res.Response]]:
+        """Delete branches with batched mutations."""
+        return self.batch_responses(
+            self.github_service.delete_branch_from_repos(github_repos, branch)
+        )
@@ -1,5 +1,10 @@
 """Merge pull request on Github use case."""
+from __future__ import annotations
+
+from typing import Any
+
 import git_portfolio.domain.pull_request_merge as prm
+import git_portfolio.responses as res
 import git_portfolio.use_cases.gh as gh
 import git_portfolio.use_cases.gh_delete_branch as dbr
 
@@ -7,6 +12,12 @@ import git_portfolio.use_cases.gh_delete_branch as dbr
 class GhMergePrUseCase(gh.GhUseCase):
     """Github merge pull request use case."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializer, see `gh.GhUseCase`."""
+        super().__init__(*args, **kwargs)
+        # repos whose head branch is deleted once every merge is done
+        self.merged_repos: list[str] = []
+
     def action(  # type: ignore[override]
         self,
         github_repo: str,
@@ -16,7 +27,30 @@ class GhMergePrUseCase(gh.GhUseCase):
         github_service_method = "merge_pull_request_from_repo"
         resp = self.call_github_service(github_service_method, github_repo, pr_merge)
         if pr_merge.delete_branch and bool(resp):
+            self.merged_repos.append(github_repo)
+
+    def batch(
+        self, github_repos: list[str], pr_merge: prm.PullRequestMerge
+    ) -> dict[str, list[res.Response]]:
+        """Report repos without a pull request to merge, skipping them."""
+        reasons = self.github_service.preflight_merges(github_repos, pr_merge)
+        return self.failure_responses(reasons)
+
+    def execute(self, pr_merge: prm.PullRequestMerge) -> list[res.Response]:
+        """Merge pull requests, then delete the merged branches in one pass."""
+        self.merged_repos = []
+        super().execute(pr_merge)
+        github_repos = (
+            [self.github_repo]
+            if self.github_repo
+            else self.config_manager.config.github_selected_repos
+        )
+        merged_repos = [repo for repo in github_repos if repo in self.merged_repos]
+        if merged_repos:
             delete_branch_use_case = dbr.GhDeleteBranchUseCase(
-                self.config_manager, self.github_service
+                self.config_manager, self.github_service, jobs=self.jobs
+            )
+            self.responses.extend(
+                delete_branch_use_case.execute_repos(merged_repos, pr_merge.head)
             )
-            delete_branch_use_case.execute(pr_merge.head)
+        return self.responses
@@ -1,6 +1,8 @@
 """Local git use case."""
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import os
 import pathlib
 import subprocess  # nosec
@@ -12,6 +14,15 @@ import git_portfolio.use_cases.command_checker as command_checker
 class GitUseCase:
     """Execution of git use case."""
 
+    def __init__(self, jobs: int | None = None) -> None:
+        """Constructor.
+
+        Args:
+            jobs: maximum number of repositories processed in parallel. Defaults to
+                the number of CPUs.
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+
     def execute(
         self, git_selected_repos: list[str], command: str, args: tuple[str, ...]
     ) -> list[res.Response]:
@@ -23,47 +34,45 @@ class GitUseCase:
             args: command arguments.
 
         Returns:
-            list[res.Response]: final results.
+            list[res.Response]: final results in the same order as the repos.
         """
         err_output = command_checker.CommandChecker().check("git")
         if err_output:
             return [res.ResponseFailure(res.ResponseTypes.SYSTEM_ERROR, err_output)]
-        responses: list[res.Response] = []
         cwd = pathlib.Path().absolute()
-        for repo_name in git_selected_repos:
-            folder_name = repo_name.split("/")[1]
-            output = f"{folder_name}: "
-            try:
-                popen = subprocess.Popen(  # nosec
-                    ["git", command, *args],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    cwd=os.path.join(cwd, folder_name),
-                )
-                stdout, error = popen.communicate()
-                if popen.returncode == 0:
-                    if stdout:
-                        stdout_str = stdout.decode("utf-8")
-                        output += f"{stdout_str}"
-                    else:
-                        output += f"{command} successful.\n"
-                    responses.append(res.ResponseSuccess(output))
+        run = functools.partial(self._run, cwd, command, args)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            return list(executor.map(run, git_selected_repos))
+
+    @staticmethod
+    def _run(
+        cwd: pathlib.Path, command: str, args: tuple[str, ...], repo_name: str
+    ) -> res.Response:
+        """Run `git` command in a single repository folder."""
+        folder_name = repo_name.split("/")[1]
+        output = f"{folder_name}: "
+        try:
+            popen = subprocess.Popen(  # nosec
+                ["git", command, *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=os.path.join(cwd, folder_name),
+            )
+            stdout, error = popen.communicate()
+            if popen.returncode == 0:
+                if stdout:
+                    stdout_str = stdout.decode("utf-8")
+                    output += f"{stdout_str}"
                 else:
-                    if error:
-                        error_str = error.decode("utf-8")
-                        output += f"{error_str}"
-                        responses.append(
-                            res.ResponseFailure(
-                                res.ResponseTypes.RESOURCE_ERROR, output
-                            )
-                        )
-                    else:
-                        stdout_str = stdout.decode("utf-8")
-                        output += f"{stdout_str}\n"
-                        responses.append(res.ResponseSuccess(output))
-            except FileNotFoundError as fnf_error:
-                output += f"{fnf_error.strerror}: {fnf_error.filename}\n"
-                responses.append(
-                    res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
-                )
-        return responses
+                    output += f"{command} successful.\n"
+                return res.ResponseSuccess(output)
+            if error:
+                error_str = error.decode("utf-8")
+                output += f"{error_str}"
+                return res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
+            stdout_str = stdout.decode("utf-8")
+            output += f"{stdout_str}\n"
+            return res.ResponseSuccess(output)
+        except FileNotFoundError as fnf_error:
+            output += f"{fnf_error.strerror}: {fnf_error.filename}\n"
+            return res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
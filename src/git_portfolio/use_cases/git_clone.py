@@ -1,21 +1,50 @@
 """Git clone use case."""
 from __future__ import annotations
 
+import concurrent.futures
+import os
 import pathlib
 import subprocess  # nosec
+from typing import TYPE_CHECKING
+from typing import Iterator
 
-import git_portfolio.github_service as ghs
+import git_portfolio.domain.clone_options as co
+import git_portfolio.mirror_cache as mc
 import git_portfolio.responses as res
 import git_portfolio.use_cases.command_checker as command_checker
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    import git_portfolio.github_service as ghs
+
+
+# clones are network and disk bound, so they get their own cap instead of the
+# CPU-based one used for local commands
+DEFAULT_JOBS = 8
+
+
 class GitCloneUseCase:
     """Execution of git clone use case."""
 
-    def __init__(self, github_service: ghs.GithubService) -> None:
-        """Constructor."""
+    def __init__(
+        self,
+        github_service: ghs.GithubService,
+        jobs: int = DEFAULT_JOBS,
+        options: co.CloneOptions | None = None,
+        mirror_cache: mc.MirrorCache | None = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            github_service: service used to resolve repository URLs.
+            jobs: maximum number of clones running at the same time.
+            options: shallow/partial clone options, full clones by default.
+            mirror_cache: mirrors used when `options.reference_cache` is set.
+        """
         self.github_service = github_service
-        self.err_output = command_checker.CommandChecker().check("git")
+        self.jobs = jobs
+        self.options = options or co.CloneOptions()
+        self.mirror_cache = mirror_cache or mc.MirrorCache()
 
     def execute(self, git_selected_repos: list[str]) -> list[res.Response]:
         """Batch `git clone` command.
@@ -24,33 +53,124 @@ class GitCloneUseCase:
             git_selected_repos: list of configured repo names.
 
         Returns:
-            list[res.Response]: final results.
+            list[res.Response]: final results in the same order as the repos.
+        """
+        results = sorted(self._clone_all(git_selected_repos), key=lambda r: r[0])
+        return [response for _, response in results]
+
+    def execute_as_completed(
+        self, git_selected_repos: list[str]
+    ) -> Iterator[res.Response]:
+        """Batch `git clone` command yielding each result as soon as it finishes.
+
+        Args:
+            git_selected_repos: list of configured repo names.
+
+        Yields:
+            res.Response: result of one clone.
         """
-        if self.err_output:
-            return [
-                res.ResponseFailure(res.ResponseTypes.SYSTEM_ERROR, self.err_output)
-            ]
-        responses: list[res.Response] = []
+        for _, response in self._clone_all(git_selected_repos):
+            yield response
+
+    def _clone_all(
+        self, git_selected_repos: list[str]
+    ) -> Iterator[tuple[int, res.Response]]:
+        """Clone repositories concurrently yielding (position, response) pairs."""
+        # the service, so its module, is already loaded by the caller
+        import git_portfolio.github_service as ghs
+
+        err_output = command_checker.CommandChecker().check("git")
+        if err_output:
+            yield 0, res.ResponseFailure(res.ResponseTypes.SYSTEM_ERROR, err_output)
+            return
         cwd = pathlib.Path().absolute()
-        for repo_name in git_selected_repos:
-            folder_name = repo_name.split("/")[1]
-            clone_path = self.github_service.get_repo_url(repo_name)
-            output = f"{folder_name}: "
-            popen = subprocess.Popen(  # nosec
-                ["git", "clone", clone_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=cwd,
-            )
-            _, error = popen.communicate()
-            # check for errors
-            if popen.returncode == 0:
-                output += "clone successful.\n"
-                responses.append(res.ResponseSuccess(output))
-            else:
-                error_str = error.decode("utf-8")
-                output += f"{error_str}"
-                responses.append(
-                    res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
-                )
-        return responses
+        existing_folders = set()
+        if self.options.existing != "fail":
+            # single pass over the workspace instead of one check per repo
+            with os.scandir(cwd) as entries:
+                existing_folders = {entry.name for entry in entries if entry.is_dir()}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {}
+            for index, repo_name in enumerate(git_selected_repos):
+                folder_name = repo_name.split("/")[1]
+                if folder_name in existing_folders:
+                    if self.options.existing == "fetch":
+                        future = executor.submit(self._fetch, cwd, folder_name)
+                        futures[future] = index
+                    else:
+                        yield index, res.ResponseSuccess(
+                            f"{folder_name}: already cloned.\n"
+                        )
+                    continue
+                # URL resolution uses the github service, so it stays on this thread
+                try:
+                    clone_path = self.github_service.get_repo_url(repo_name)
+                except (NameError, ghs.GithubServiceError) as error:
+                    yield index, res.ResponseFailure(
+                        res.ResponseTypes.RESOURCE_ERROR,
+                        f"{folder_name}: {str(error).rstrip()}\n",
+                    )
+                    continue
+                future = executor.submit(self._clone, cwd, repo_name, clone_path)
+                futures[future] = index
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+
+    def _clone_args(self) -> list[str]:
+        """Return `git clone` arguments for the configured options."""
+        args = []
+        if self.options.depth:
+            args.append(f"--depth={self.options.depth}")
+        if self.options.filter_spec:
+            args.append(f"--filter={self.options.filter_spec}")
+        if self.options.single_branch:
+            args.append("--single-branch")
+        return args
+
+    def _clone(
+        self, cwd: pathlib.Path, repo_name: str, clone_path: str
+    ) -> res.Response:
+        """Clone a single repository."""
+        folder_name = repo_name.split("/")[1]
+        output = f"{folder_name}: "
+        args = self._clone_args()
+        if self.options.reference_cache:
+            # a failed refresh only means the clone downloads everything
+            if not self.mirror_cache.refresh(repo_name, clone_path):
+                mirror_path = self.mirror_cache.mirror_path(repo_name)
+                # the mirror prunes objects of deleted branches, so clones copy
+                # what they borrow instead of depending on it, at the cost of
+                # disk space but still without downloading it
+                args.extend([f"--reference-if-able={mirror_path}", "--dissociate"])
+        popen = subprocess.Popen(  # nosec
+            ["git", "clone", *args, clone_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+        )
+        _, error = popen.communicate()
+        # check for errors
+        if popen.returncode == 0:
+            output += "clone successful.\n"
+            return res.ResponseSuccess(output)
+        error_str = error.decode("utf-8")
+        output += f"{error_str}"
+        return res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
+
+    @staticmethod
+    def _fetch(cwd: pathlib.Path, folder_name: str) -> res.Response:
+        """Fetch a repository that is already cloned."""
+        output = f"{folder_name}: "
+        popen = subprocess.Popen(  # nosec
+            ["git", "fetch"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=os.path.join(cwd, folder_name),
+        )
+        _, error = popen.communicate()
+        if popen.returncode == 0:
+            output += "already cloned, fetch successful.\n"
+            return res.ResponseSuccess(output)
+        error_str = error.decode("utf-8")
+        output += f"{error_str}"
+        return res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, output)
@@ -0,0 +1,31 @@
+"""Test cases for the clone options model."""
+import git_portfolio.domain.clone_options as co
+
+
+def test_clone_options_model_init() -> None:
+    """Verify model initialization."""
+    depth = 1
+    filter_spec = "blob:none"
+    single_branch = True
+    reference_cache = True
+    existing = "skip"
+    test_co = co.CloneOptions(
+        depth, filter_spec, single_branch, reference_cache, existing
+    )
+
+    assert test_co.depth == depth
+    assert test_co.filter_spec == filter_spec
+    assert test_co.single_branch == single_branch
+    assert test_co.reference_cache == reference_cache
+    assert test_co.existing == existing
+
+
+def test_clone_options_model_defaults() -> None:
+    """Verify model defaults to a full clone."""
+    test_co = co.CloneOptions()
+
+    assert test_co.depth is None
+    assert test_co.filter_spec is None
+    assert test_co.single_branch is False
+    assert test_co.reference_cache is False
+    assert test_co.existing == "fail"
@@ -94,3 +94,80 @@ def test_save_config_success(
     manager = cm.ConfigManager()
     manager.save_config()
     mock_yaml_dump.assert_called_once()
+
+
+CONFIG_CONTENT = (
+    "github_access_token: aaaaabbbbbccccc12345\n"
+    "github_hostname: ''\n"
+    "github_selected_repos:\n"
+    " - user/test\n"
+)
+
+
+def test_init_writes_cache(
+    tmp_path: pathlib.Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It writes the parsed config cache next to the YAML file."""
+    p = tmp_path / "config.yaml"
+    p.write_text(CONFIG_CONTENT)
+    mock_os_join_path.side_effect = [str(tmp_path), str(p)]
+    cm.ConfigManager()
+
+    assert (tmp_path / "config.cache.json").exists()
+
+
+def test_init_uses_fresh_cache(
+    mocker: MockerFixture, tmp_path: pathlib.Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It does not parse YAML when the cache is fresh."""
+    p = tmp_path / "config.yaml"
+    p.write_text(CONFIG_CONTENT)
+    mock_os_join_path.side_effect = [str(tmp_path), str(p)] * 2
+    cm.ConfigManager()
+    mock_safe_load = mocker.patch("yaml.safe_load")
+    manager = cm.ConfigManager()
+
+    mock_safe_load.assert_not_called()
+    assert manager.config.github_access_token == "aaaaabbbbbccccc12345"
+    assert manager.config.github_selected_repos == ["user/test"]
+
+
+def test_init_rebuilds_stale_cache(
+    tmp_path: pathlib.Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It parses YAML again when it changed after the cache was written."""
+    p = tmp_path / "config.yaml"
+    p.write_text(CONFIG_CONTENT)
+    mock_os_join_path.side_effect = [str(tmp_path), str(p)] * 2
+    cm.ConfigManager()
+    p.write_text(CONFIG_CONTENT + " - user/other\n")
+    manager = cm.ConfigManager()
+
+    assert manager.config.github_selected_repos == ["user/test", "user/other"]
+
+
+def test_init_invalid_cache(
+    tmp_path: pathlib.Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It ignores a corrupted cache."""
+    p = tmp_path / "config.yaml"
+    p.write_text(CONFIG_CONTENT)
+    (tmp_path / "config.cache.json").write_text("{not json")
+    mock_os_join_path.side_effect = [str(tmp_path), str(p)]
+    manager = cm.ConfigManager()
+
+    assert manager.config.github_selected_repos == ["user/test"]
+
+
+def test_save_config_updates_cache(
+    tmp_path: pathlib.Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It refreshes the cache with the saved config."""
+    p = tmp_path / "config.yaml"
+    p.write_text(CONFIG_CONTENT)
+    mock_os_join_path.side_effect = [str(tmp_path), str(p)] * 2
+    manager = cm.ConfigManager()
+    manager.config.github_selected_repos = ["user/new"]
+    manager.save_config()
+
+    assert cm.ConfigManager().config.github_selected_repos == ["user/new"]
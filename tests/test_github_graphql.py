@@ -0,0 +1,325 @@
+"""Test cases for the GitHub GraphQL module."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import git_portfolio.github_graphql as gq
+from tests.conftest import REPO
+from tests.conftest import REPO2
+
+
+URL = "https://api.github.com/graphql"
+
+
+def _client(
+    mocker: MockerFixture, *payloads: dict[str, Any], status_code: int = 200
+) -> gq.GraphqlClient:
+    """Return client whose session answers payloads in order."""
+    session = mocker.Mock()
+    session.post.side_effect = [
+        mocker.Mock(status_code=status_code, json=mocker.Mock(return_value=payload))
+        for payload in payloads
+    ]
+    return gq.GraphqlClient(session, URL)
+
+
+def _item(
+    number: int, created_at: str, labels: list[str] | None = None
+) -> dict[str, Any]:
+    """Return issue or pull request node."""
+    names = labels or []
+    return {
+        "id": f"node{number}",
+        "number": number,
+        "title": f"title {number}",
+        "body": "",
+        "state": "OPEN",
+        "createdAt": created_at,
+        "labels": {
+            "totalCount": len(names),
+            "nodes": [{"name": name} for name in names],
+        },
+    }
+
+
+def _connection(*items: dict[str, Any], next_page: bool = False) -> dict[str, Any]:
+    """Return connection of nodes."""
+    return {"pageInfo": {"hasNextPage": next_page}, "nodes": list(items)}
+
+
+def test_execute(mocker: MockerFixture) -> None:
+    """It returns data and errors by alias."""
+    client = _client(
+        mocker,
+        {
+            "data": {"r0": {"id": "1"}, "r1": None},
+            "errors": [{"message": "Could not resolve", "path": ["r1"]}],
+        },
+    )
+
+    data, errors = client.execute("query { a }")
+
+    assert data == {"r0": {"id": "1"}, "r1": None}
+    assert errors == {"r1": "Could not resolve"}
+    client.session.post.assert_called_once_with(URL, json={"query": "query { a }"})
+
+
+def test_execute_not_found(mocker: MockerFixture) -> None:
+    """It raises unavailable error."""
+    client = _client(mocker, {"message": "Not Found"}, status_code=404)
+
+    with pytest.raises(gq.GraphqlUnavailableError):
+        client.execute("query { a }")
+
+
+def test_execute_schema_error(mocker: MockerFixture) -> None:
+    """It raises unavailable error."""
+    client = _client(
+        mocker,
+        {"errors": [{"message": "Field 'x' doesn't exist", "type": "undefinedField"}]},
+    )
+
+    with pytest.raises(gq.GraphqlUnavailableError):
+        client.execute("query { x }")
+
+
+def test_execute_error(mocker: MockerFixture) -> None:
+    """It raises error when the whole query fails."""
+    client = _client(mocker, {"errors": [{"message": "Timeout"}]})
+
+    with pytest.raises(gq.GraphqlError, match="Timeout"):
+        client.execute("query { a }")
+
+
+def test_query_repositories_chunks(mocker: MockerFixture) -> None:
+    """It splits repositories so each query stays under the node limit."""
+    client = _client(mocker, {"data": {"r0": {"a": 1}}}, {"data": {"r0": None}})
+
+    found = gq.query_repositories(client, [REPO, REPO2], "a", gq.NODE_LIMIT)
+
+    assert found == {REPO: {"a": 1}}
+    assert client.session.post.call_count == 2
+    query = client.session.post.call_args_list[0].kwargs["json"]["query"]
+    assert 'r0: repository(owner: "org", name: "repo-name") { a }' in query
+
+
+def test_list_issues(mocker: MockerFixture) -> None:
+    """It merges issues and pull requests newest first."""
+    client = _client(
+        mocker,
+        {
+            "data": {
+                "r0": {
+                    "issues": _connection(
+                        _item(1, "2024-01-01"), _item(3, "2024-03-01")
+                    ),
+                    "pullRequests": _connection(_item(2, "2024-02-01", ["bug"])),
+                },
+                "r1": {
+                    "issues": _connection(next_page=True),
+                    "pullRequests": _connection(),
+                },
+            }
+        },
+    )
+
+    found = gq.list_issues(client, [REPO, REPO2], "open")
+
+    assert list(found) == [REPO]
+    assert [issue.number for issue in found[REPO]] == [3, 2, 1]
+    assert found[REPO][1] == gq.ListedIssue(
+        2, "title 2", "", {"bug"}, True, "node2", "open"
+    )
+    query = client.session.post.call_args.kwargs["json"]["query"]
+    assert "states: [OPEN]" in query
+
+
+def test_list_issues_too_many_labels(mocker: MockerFixture) -> None:
+    """It leaves out repositories with issues having more labels than read."""
+    item = _item(1, "2024-01-01", ["bug"])
+    item["labels"]["totalCount"] = gq.LABELS_PAGE_SIZE + 1
+    client = _client(
+        mocker,
+        {"data": {"r0": {"issues": _connection(item), "pullRequests": _connection()}}},
+    )
+
+    assert gq.list_issues(client, [REPO], "all") == {}
+
+
+def test_list_pull_requests(mocker: MockerFixture) -> None:
+    """It keeps pull requests from the head owner."""
+    client = _client(
+        mocker,
+        {
+            "data": {
+                "r0": {
+                    "pullRequests": {
+                        "nodes": [
+                            {
+                                "id": "pr1",
+                                "number": 1,
+                                "headRepositoryOwner": {"login": "Org"},
+                            },
+                            {
+                                "id": "pr2",
+                                "number": 2,
+                                "headRepositoryOwner": {"login": "fork"},
+                            },
+                            {"id": "pr3", "number": 3, "headRepositoryOwner": None},
+                        ]
+                    }
+                }
+            }
+        },
+    )
+
+    found = gq.list_pull_requests(client, [REPO], "main", "branch", "org")
+
+    assert found == {REPO: [gq.PullRequestRef(1, "pr1")]}
+
+
+def test_find_branches(mocker: MockerFixture) -> None:
+    """It tells which repositories have the branch."""
+    client = _client(
+        mocker, {"data": {"r0": {"ref": {"id": "ref1"}}, "r1": {"ref": None}}}
+    )
+
+    found = gq.find_branches(client, [REPO, REPO2], "branch")
+
+    assert found == {REPO: gq.BranchRef(True, "ref1"), REPO2: gq.BranchRef(False, "")}
+    query = client.session.post.call_args.kwargs["json"]["query"]
+    assert 'ref(qualifiedName: "refs/heads/branch")' in query
+
+
+def test_find_issue_targets(mocker: MockerFixture) -> None:
+    """It returns repository ids and the labels found."""
+    client = _client(
+        mocker,
+        {
+            "data": {
+                "r0": {
+                    "id": "repo1",
+                    "hasIssuesEnabled": True,
+                    "l0": {"id": "label1"},
+                    "l1": None,
+                }
+            }
+        },
+    )
+
+    found = gq.find_issue_targets(client, [REPO], ["bug", "missing"])
+
+    assert found == {REPO: gq.IssueTarget("repo1", True, {"bug": "label1"})}
+    query = client.session.post.call_args.kwargs["json"]["query"]
+    assert 'l1: label(name: "missing") { id }' in query
+
+
+def test_mutations() -> None:
+    """It returns mutations for issues or pull requests."""
+    assert gq.create_issue("repo1", 'say "hi"', "ção", ["label1"]) == (
+        'createIssue(input: {repositoryId: "repo1", title: "say \\"hi\\"", '
+        'body: "ção", labelIds: ["label1"]}) { issue { number } }'
+    )
+    assert gq.close_issue("node1", False).startswith("closeIssue(")
+    assert gq.close_issue("node1", True).startswith("closePullRequest(")
+    assert gq.reopen_issue("node1", False).startswith("reopenIssue(")
+    assert gq.reopen_issue("node1", True).startswith("reopenPullRequest(")
+    assert gq.delete_ref("ref1") == (
+        'deleteRef(input: {refId: "ref1"}) { clientMutationId }'
+    )
+
+
+def test_run_mutations(mocker: MockerFixture) -> None:
+    """It maps errors of aliases back to their keys."""
+    mocker.patch.object(gq, "MAX_MUTATIONS_PER_DOCUMENT", 2)
+    client = _client(
+        mocker,
+        {
+            "data": {"m0": {}, "m1": None},
+            "errors": [{"message": "Could not close", "path": ["m1", "closeIssue"]}],
+        },
+        {"data": {"m0": {}}},
+    )
+
+    outcomes = gq.run_mutations(client, [(REPO, "a"), (REPO2, "b"), (REPO2, "c")])
+
+    assert outcomes == {REPO: None, REPO2: "Could not close"}
+    queries = [call.kwargs["json"]["query"] for call in client.session.post.mock_calls]
+    assert queries == ["mutation { m0: a m1: b }", "mutation { m0: c }"]
+
+
+def test_run_mutations_unavailable(mocker: MockerFixture) -> None:
+    """It raises before any mutation ran, otherwise maps the error to keys."""
+    mocker.patch.object(gq, "MAX_MUTATIONS_PER_DOCUMENT", 1)
+    client = _client(mocker, {"message": "Not Found"}, status_code=404)
+
+    with pytest.raises(gq.GraphqlUnavailableError):
+        gq.run_mutations(client, [(REPO, "a")])
+
+    client = _client(mocker, {"data": {"m0": {}}}, {"errors": [{"message": "Boom"}]})
+
+    outcomes = gq.run_mutations(client, [(REPO, "a"), (REPO2, "b")])
+
+    assert outcomes == {REPO: None, REPO2: "Boom"}
+
+
+def test_compare_branches(mocker: MockerFixture) -> None:
+    """It tells whether branches exist and how far head is ahead of base."""
+    client = _client(
+        mocker,
+        {
+            "data": {
+                "r0": {"base": {"compare": {"aheadBy": 2}}, "head": {"id": "ref1"}},
+                "r1": {"base": None, "head": None},
+            }
+        },
+    )
+
+    found = gq.compare_branches(client, [REPO, REPO2], "main", "branch")
+
+    assert found == {
+        REPO: gq.BranchComparison(True, True, 2),
+        REPO2: gq.BranchComparison(False, False, None),
+    }
+    query = client.session.post.call_args.kwargs["json"]["query"]
+    assert 'compare(headRef: "branch") { aheadBy }' in query
+
+
+def test_run_mutations_retries_rate_limited(mocker: MockerFixture) -> None:
+    """It sends rate limited mutations again after a wait."""
+    sleep = mocker.patch("time.sleep")
+    limited = "You have exceeded a secondary rate limit."
+    client = _client(
+        mocker,
+        {
+            "data": {"m0": {}, "m1": None},
+            "errors": [{"message": limited, "path": ["m1"]}],
+        },
+        {"data": {"m0": {}}},
+    )
+
+    outcomes = gq.run_mutations(client, [(REPO, "a"), (REPO2, "b")], retry_wait=5)
+
+    assert outcomes == {REPO: None, REPO2: None}
+    assert client.session.post.call_args.kwargs["json"]["query"] == (
+        "mutation { m0: b }"
+    )
+    sleep.assert_called_once_with(5)
+
+
+def test_run_mutations_rate_limited_gives_up(mocker: MockerFixture) -> None:
+    """It reports mutations still rate limited after the retries."""
+    mocker.patch("time.sleep")
+    limited = {
+        "data": {"m0": None},
+        "errors": [{"message": "rate limit", "path": ["m0"]}],
+    }
+    client = _client(mocker, limited, limited)
+
+    outcomes = gq.run_mutations(client, [(REPO, "a")], max_retries=1)
+
+    assert outcomes == {REPO: "rate limit"}
+    assert client.session.post.call_count == 2
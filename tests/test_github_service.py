@@ -1,6 +1,7 @@
 """Test cases for the Github service module."""
 from __future__ import annotations
 
+import threading
 import unittest
 
 import github3
@@ -124,10 +125,14 @@ def test_init_github_entreprise(
     mock_github3_enterprise_login: MockerFixture,
 ) -> None:
     """It succeeds."""
-    gs.GithubService(domain_gh_conn_settings[1])
+    gs.GithubService(domain_gh_conn_settings[1]).get_username()
+
+    mock_github3_enterprise_login.assert_called_once_with(
+        url="https://myhost.com/api/v3", token="my-token"
+    )
 
 
-def test_init_invalid_token(
+def test_connection_invalid_token(
     mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
@@ -140,10 +145,10 @@ def test_init_invalid_token(
         gs.GithubServiceError,
         match="Wrong GitHub permissions. Please check your token.",
     ):
-        gs.GithubService(domain_gh_conn_settings[0])
+        gs.GithubService(domain_gh_conn_settings[0]).get_username()
 
 
-def test_init_invalid_token_scope(
+def test_connection_invalid_token_scope(
     mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
@@ -153,14 +158,14 @@ def test_init_invalid_token_scope(
         github3.exceptions.IncompleteResponse(mocker.Mock(), mocker.Mock())
     )
     with pytest.raises(gs.GithubServiceError) as excinfo:
-        gs.GithubService(domain_gh_conn_settings[0])
+        gs.GithubService(domain_gh_conn_settings[0]).get_username()
 
     assert "Invalid response. Your token might not be properly scoped." == str(
         excinfo.value
     )
 
 
-def test_init_connection_error(
+def test_connection_error(
     mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
@@ -170,7 +175,63 @@ def test_init_connection_error(
         mocker.Mock()
     )
     with pytest.raises(gs.GithubServiceError):
-        gs.GithubService(domain_gh_conn_settings[0])
+        gs.GithubService(domain_gh_conn_settings[0]).get_username()
+
+
+def test_init_deferred_connection(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It does not connect before first use."""
+    gs.GithubService(domain_gh_conn_settings[0])
+
+    mock_github3_login.assert_not_called()
+
+
+def test_connection_http_cache(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It routes the session through the HTTP cache and rate limiter."""
+    mock_mount = mocker.patch("git_portfolio.http_cache.mount")
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    service.get_username()
+
+    mock_mount.assert_called_once_with(
+        mock_github3_login.return_value.session, limiter=service.rate_limiter
+    )
+
+
+def test_connection_tested_once(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It caches the authenticated user."""
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    service.get_username()
+    service.get_repo_names()
+    service.get_username()
+
+    mock_github3_login.assert_called_once()
+    mock_github3_login.return_value.me.assert_called_once()
+
+
+def test_connection_error_cached(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It does not test a failed connection again."""
+    mock_github3_login.return_value.me.side_effect = (
+        github3.exceptions.AuthenticationFailed(mocker.Mock())
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    for _ in range(2):
+        with pytest.raises(gs.GithubServiceError):
+            service.get_repo_url(REPO)
+
+    mock_github3_login.return_value.me.assert_called_once()
 
 
 def test_get_config(
@@ -320,11 +381,11 @@ def test_list_issues_from_repo_title_filter(
     label3.name = LABEL_BUG
 
     issue1 = mocker.Mock(number=DOMAIN_ISSUES[1].number, title=DOMAIN_ISSUES[1].title)
-    issue1.labels.return_value = [label1]
+    issue1.original_labels = [label1]
     issue2 = mocker.Mock(number=DOMAIN_ISSUES[2].number, title=DOMAIN_ISSUES[2].title)
-    issue2.labels.return_value = []
+    issue2.original_labels = []
     issue3 = mocker.Mock(number=DOMAIN_ISSUES[3].number, title=DOMAIN_ISSUES[3].title)
-    issue3.labels.return_value = [label2, label3]
+    issue3.original_labels = [label2, label3]
 
     repo = mock_github3_login.return_value.repositories.return_value[1]
     repo.issues.return_value = [
@@ -344,8 +405,11 @@ def test_list_issues_from_repo_title_filter(
     assert len(response) == 2
     assert response[0].number == DOMAIN_ISSUES[2].number
     assert response[0].title == DOMAIN_ISSUES[2].title
+    assert response[0].labels == set()
     assert response[1].number == DOMAIN_ISSUES[3].number
     assert response[1].title == DOMAIN_ISSUES[3].title
+    assert response[1].labels == {LABEL_ENHANCEMENT, LABEL_BUG}
+    issue3.labels.assert_not_called()
 
 
 @pytest.mark.parametrize("value", ["issue", "pull request"])
@@ -366,13 +430,13 @@ def test_list_issues_from_repo_obj_filter(
         title=DOMAIN_ISSUES[2].title,
         pull_request_urls=None,
     )
-    issue1.labels.return_value = []
+    issue1.original_labels = []
     issue2 = mocker.Mock(
         number=DOMAIN_ISSUES[3].number,
         title=DOMAIN_ISSUES[3].title,
         pull_request_urls="something",
     )
-    issue2.labels.return_value = [label1, label2]
+    issue2.original_labels = [label1, label2]
 
     repo = mock_github3_login.return_value.repositories.return_value[1]
     repo.issues.return_value = [
@@ -397,6 +461,25 @@ def test_list_issues_from_repo_obj_filter(
         assert response[0].title == DOMAIN_ISSUES[3].title
 
 
+def test_list_issues_from_repo_title_substring(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It matches title filters inside words."""
+    issue1 = mocker.Mock(number=1, title="Update deps", original_labels=[])
+    issue2 = mocker.Mock(number=2, title="Fix typo", original_labels=[])
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.issues.return_value = [issue1, issue2]
+
+    response = gs.GithubService(domain_gh_conn_settings[0]).list_issues_from_repo(
+        REPO, il.IssueListValidRequest(filters={"title__contains": "dep"})
+    )
+
+    mock_github3_login.return_value.search_issues.assert_not_called()
+    assert [issue.number for issue in response] == [1]
+
+
 def test_list_issues_from_repo_no_filter_request(
     mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
@@ -404,9 +487,9 @@ def test_list_issues_from_repo_no_filter_request(
 ) -> None:
     """It returns empty result."""
     issue1 = mocker.Mock(number=DOMAIN_ISSUES[0].number, title=DOMAIN_ISSUES[0].title)
-    issue1.labels.return_value = []
+    issue1.original_labels = []
     issue2 = mocker.Mock(number=DOMAIN_ISSUES[1].number, title=DOMAIN_ISSUES[1].title)
-    issue2.labels.return_value = []
+    issue2.original_labels = []
     repo = mock_github3_login.return_value.repositories.return_value[1]
     repo.issues.return_value = [
         issue1,
@@ -417,6 +500,7 @@ def test_list_issues_from_repo_no_filter_request(
         REPO, il.IssueListValidRequest()
     )
 
+    repo.issues.assert_called_once()
     assert len(response) == 2
     assert response[0].number == DOMAIN_ISSUES[0].number
     assert response[0].title == DOMAIN_ISSUES[0].title
@@ -424,17 +508,188 @@ def test_list_issues_from_repo_no_filter_request(
     assert response[1].title == DOMAIN_ISSUES[1].title
 
 
+def test_warm_up(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists issues of selected repositories only once."""
+    repo = mock_github3_login.return_value.repository.return_value
+    repo.issues.return_value = []
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    service.warm_up(("open",)).join()
+    response = service.list_issues_from_repo(
+        REPO,
+        il.build_list_request(filters={"obj__eq": "issue", "state__eq": "open"}),
+    )
+
+    assert response == []
+    repo.issues.assert_called_once_with(state="open")
+
+
+def test_warm_up_graphql_without_repositories(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists issues with GraphQL without resolving repositories first."""
+    empty = {"pageInfo": {"hasNextPage": False}, "nodes": []}
+    connection = mock_github3_login.return_value
+    connection.session.post.return_value = _graphql_answer(
+        mocker, {"r0": {"issues": empty, "pullRequests": empty}}
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    service.warm_up(("open",)).join()
+
+    connection.session.post.assert_called_once()
+    connection.repository.assert_not_called()
+
+
+def test_warm_up_daemon_workers(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists issues in daemon threads that do not hold the exit."""
+    daemons = []
+
+    def list_issues(state: str) -> list[MockerFixture]:
+        daemons.append(threading.current_thread().daemon)
+        return []
+
+    repo = mock_github3_login.return_value.repository.return_value
+    repo.issues.side_effect = list_issues
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    service.warm_up(("open", "closed")).join()
+
+    assert daemons == [True, True]
+
+
+def test_warm_up_connection_error(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It ignores errors and raises them again on use."""
+    mock_github3_login.return_value.me.side_effect = github3.exceptions.ConnectionError(
+        mocker.Mock()
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    service.warm_up(("open",)).join()
+
+    with pytest.raises(gs.GithubServiceError):
+        service.get_username()
+
+
+def test_list_issues_from_repo_failure_not_cached(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists issues again after a failure."""
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.issues.side_effect = [ConnectionError, []]
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    request = il.IssueListValidRequest()
+
+    with pytest.raises(ConnectionError):
+        service.list_issues_from_repo(REPO, request)
+
+    assert service.list_issues_from_repo(REPO, request) == []
+
+
+def _graphql_answer(mocker: MockerFixture, data: dict[str, object]) -> MockerFixture:
+    """Return GraphQL response with data."""
+    return mocker.Mock(status_code=200, json=mocker.Mock(return_value={"data": data}))
+
+
+def test_list_issues_from_repo_graphql(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists issues of all selected repositories with one query."""
+    items = {
+        "pageInfo": {"hasNextPage": False},
+        "nodes": [
+            {
+                "id": "node1",
+                "number": 1,
+                "title": "title",
+                "body": "body",
+                "state": "OPEN",
+                "createdAt": "2024-01-01T00:00:00Z",
+                "labels": {"totalCount": 1, "nodes": [{"name": LABEL_BUG}]},
+            }
+        ],
+    }
+    empty = {"pageInfo": {"hasNextPage": False}, "nodes": []}
+    connection = mock_github3_login.return_value
+    connection.session.post.return_value = _graphql_answer(
+        mocker,
+        {
+            "r0": {"issues": items, "pullRequests": empty},
+            "r1": {"issues": empty, "pullRequests": empty},
+        },
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2])
+    request = il.build_list_request(filters={"obj__eq": "issue"})
+
+    assert service.list_issues_from_repo(REPO, request) == [
+        i.Issue(1, "title", "body", {LABEL_BUG})
+    ]
+    assert service.list_issues_from_repo(REPO2, request) == []
+    connection.session.post.assert_called_once()
+    assert connection.session.post.call_args.args == (
+        "https://api.github.com/graphql",
+    )
+    connection.repository.return_value.issues.assert_not_called()
+
+
+def test_list_issues_from_repo_graphql_unavailable(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_enterprise_login: MockerFixture,
+) -> None:
+    """It falls back to REST and stops using GraphQL."""
+    connection = mock_github3_enterprise_login.return_value
+    connection.session.post.return_value = mocker.Mock(status_code=404)
+    repo = connection.repository.return_value
+    repo.issues.return_value = []
+    service = gs.GithubService(domain_gh_conn_settings[1], [REPO])
+
+    assert service.list_issues_from_repo(REPO, il.IssueListValidRequest()) == []
+    service.delete_branch_from_repo(REPO, BRANCH_NAME)
+
+    connection.session.post.assert_called_once_with(
+        "https://myhost.com/api/graphql", json=mocker.ANY
+    )
+    repo.ref.assert_called_once_with(f"heads/{BRANCH_NAME}")
+
+
 def test_close_issues_from_repo_success(
+    mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
-    """It succeeds."""
-    mock_github3_login.return_value.issue().is_closed.return_value = False
+    """It closes each issue with one request in the repository."""
+    session = mock_github3_login.return_value.session
+    session.build_url.side_effect = lambda *parts: "/".join(parts)
+    session.patch.return_value = mocker.Mock(status_code=200)
     response = gs.GithubService(domain_gh_conn_settings[0]).close_issues_from_repo(
-        REPO, DOMAIN_ISSUES
+        REPO, DOMAIN_ISSUES[:2]
     )
 
     assert response == f"{REPO}: close issues successful.\n"
+    assert session.patch.call_args_list == [
+        mocker.call(
+            f"repos/org/repo-name/issues/{issue.number}", json={"state": "closed"}
+        )
+        for issue in DOMAIN_ISSUES[:2]
+    ]
+    mock_github3_login.return_value.issue.assert_not_called()
 
 
 def test_close_issues_from_repo_no_issue(
@@ -442,7 +697,6 @@ def test_close_issues_from_repo_no_issue(
     mock_github3_login: MockerFixture,
 ) -> None:
     """It returns a not issue message."""
-    mock_github3_login.return_value.issue().is_closed.return_value = False
     response = gs.GithubService(domain_gh_conn_settings[0]).close_issues_from_repo(
         REPO, []
     )
@@ -451,28 +705,76 @@ def test_close_issues_from_repo_no_issue(
 
 
 def test_close_issues_from_repo_already_closed(
+    mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
-    """It succeeds."""
-    mock_github3_login.return_value.issue().is_closed.return_value = True
-    response = gs.GithubService(domain_gh_conn_settings[0]).close_issues_from_repo(
-        REPO, DOMAIN_ISSUES
-    )
+    """It skips issues listed as closed."""
+    issue = mocker.Mock(number=1, title="title", state="closed", original_labels=[])
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.issues.return_value = [issue]
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    issues = service.list_issues_from_repo(REPO, il.IssueListValidRequest())
+
+    response = service.close_issues_from_repo(REPO, issues)
 
     assert response == f"{REPO}: close issues successful.\n"
+    mock_github3_login.return_value.session.patch.assert_not_called()
+
+
+def test_close_issues_from_repo_then_reopen(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It records closed issues so reopening them is not skipped."""
+    issue = mocker.Mock(number=1, title="title", state="open", original_labels=[])
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.issues.return_value = [issue]
+    session = mock_github3_login.return_value.session
+    session.patch.return_value = mocker.Mock(status_code=200)
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    issues = service.list_issues_from_repo(REPO, il.IssueListValidRequest())
+
+    service.close_issues_from_repo(REPO, issues)
+    service.reopen_issues_from_repo(REPO, issues)
+
+    assert [call.kwargs["json"] for call in session.patch.call_args_list] == [
+        {"state": "closed"},
+        {"state": "open"},
+    ]
+
+
+def test_close_issues_from_repo_error(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It gives the message error returned from the API."""
+    mock_github3_login.return_value.session.patch.return_value = mocker.Mock(
+        status_code=410, json=mocker.Mock(return_value={"message": "Issues disabled"})
+    )
+
+    with pytest.raises(gs.GithubServiceError, match=f"{REPO}: Issues disabled"):
+        gs.GithubService(domain_gh_conn_settings[0]).close_issues_from_repo(
+            REPO, DOMAIN_ISSUES
+        )
 
 
 def test_reopen_issues_from_repo_success(
+    mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
     """It succeeds."""
+    session = mock_github3_login.return_value.session
+    session.patch.return_value = mocker.Mock(status_code=200)
     response = gs.GithubService(domain_gh_conn_settings[0]).reopen_issues_from_repo(
         REPO, DOMAIN_ISSUES
     )
 
     assert response == f"{REPO}: reopen issues successful.\n"
+    assert session.patch.call_args.kwargs == {"json": {"state": "open"}}
 
 
 def test_reopen_issues_from_repo_no_issue(
@@ -488,15 +790,20 @@ def test_reopen_issues_from_repo_no_issue(
 
 
 def test_reopen_issues_from_repo_error(
-    mock_github3_unprocessable_entity_exception: MockerFixture,
+    mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
     """It returns a not issue message."""
-    repo = mock_github3_login.return_value.issue.return_value
-    repo.reopen.side_effect = github3.exceptions.UnprocessableEntity
+    mock_github3_login.return_value.session.patch.return_value = mocker.Mock(
+        status_code=422,
+        json=mocker.Mock(return_value={"message": "Validation Failed"}),
+    )
 
-    with pytest.raises(gs.GithubServiceError):
+    with pytest.raises(
+        gs.GithubServiceError,
+        match=f"{REPO}: Validation Failed. Probably the branch was deleted.",
+    ):
         gs.GithubService(domain_gh_conn_settings[0]).reopen_issues_from_repo(
             REPO, DOMAIN_ISSUES
         )
@@ -515,15 +822,42 @@ def test_create_pull_request_from_repo_success(
 
 
 def test_create_pull_request_from_repo_with_labels(
+    mocker: MockerFixture,
     domain_gh_conn_settings: list[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
-    """It succeeds."""
+    """It labels the created number with one request."""
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.create_pull.return_value.number = 7
+    session = mock_github3_login.return_value.session
+    session.build_url.side_effect = lambda *parts: "/".join(parts)
+    session.post.return_value = mocker.Mock(status_code=200)
     response = gs.GithubService(
         domain_gh_conn_settings[0]
     ).create_pull_request_from_repo(REPO, DOMAIN_PRS[1])
 
     assert response == f"{REPO}: create PR successful.\n"
+    session.post.assert_called_once_with(
+        "repos/org/repo-name/issues/7/labels",
+        json={"labels": sorted(DOMAIN_PRS[1].labels)},
+    )
+    repo.create_pull.return_value.issue.assert_not_called()
+
+
+def test_create_pull_request_from_repo_labels_error(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It gives the message error returned from the API."""
+    mock_github3_login.return_value.session.post.return_value = mocker.Mock(
+        status_code=403, json=mocker.Mock(return_value={"message": "Forbidden"})
+    )
+
+    with pytest.raises(gs.GithubServiceError, match=f"{REPO}: Forbidden"):
+        gs.GithubService(domain_gh_conn_settings[0]).create_pull_request_from_repo(
+            REPO, DOMAIN_PRS[1]
+        )
 
 
 def test_create_pull_request_from_repo_no_commits(
@@ -726,3 +1060,356 @@ def test_merge_pull_request_from_repo_ambiguous(
     ).merge_pull_request_from_repo(REPO, DOMAIN_MPR)
 
     assert response == f"{REPO}: unexpected number of PRs for branch:main.\n"
+
+
+def test_delete_branch_from_repo_graphql(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It deletes branches found by one query."""
+    session = mock_github3_login.return_value.session
+    session.post.return_value = _graphql_answer(
+        mocker, {"r0": {"ref": {"id": "ref1"}}, "r1": {"ref": None}}
+    )
+    session.build_url.side_effect = lambda *parts: "/".join(parts)
+    session.delete.return_value = mocker.Mock(status_code=204)
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2])
+
+    assert (
+        service.delete_branch_from_repo(REPO, BRANCH_NAME)
+        == f"{REPO}: delete branch successful.\n"
+    )
+    assert service.delete_branch_from_repo(REPO2, BRANCH_NAME) == (
+        f"{REPO2}: Not Found.\n"
+    )
+    session.delete.assert_called_once_with(
+        f"repos/org/repo-name/git/refs/heads/{BRANCH_NAME}"
+    )
+    session.post.assert_called_once()
+
+
+def test_delete_branch_from_repo_graphql_error(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It gives the message error returned from the API."""
+    session = mock_github3_login.return_value.session
+    session.post.return_value = _graphql_answer(mocker, {"r0": {"ref": {"id": "1"}}})
+    session.delete.return_value = mocker.Mock(
+        status_code=422, json=mocker.Mock(return_value={"message": "returned message"})
+    )
+
+    with pytest.raises(gs.GithubServiceError, match=f"{REPO}: returned message"):
+        gs.GithubService(domain_gh_conn_settings[0], [REPO]).delete_branch_from_repo(
+            REPO, BRANCH_NAME
+        )
+
+
+def test_merge_pull_request_from_repo_graphql(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It merges the pull request found by one query."""
+    session = mock_github3_login.return_value.session
+    pull = {"id": "pr1", "number": 7, "headRepositoryOwner": {"login": "org name"}}
+    session.post.return_value = _graphql_answer(
+        mocker, {"r0": {"pullRequests": {"nodes": [pull]}}}
+    )
+    session.build_url.side_effect = lambda *parts: "/".join(parts)
+    session.put.return_value = mocker.Mock(status_code=200)
+    response = gs.GithubService(
+        domain_gh_conn_settings[0], [REPO]
+    ).merge_pull_request_from_repo(REPO, DOMAIN_MPR)
+
+    assert response == f"{REPO}: merge PR successful.\n"
+    session.put.assert_called_once_with("repos/org/repo-name/pulls/7/merge", json={})
+    repo = mock_github3_login.return_value.repository.return_value
+    repo.pull_requests.assert_not_called()
+
+
+def test_merge_pull_request_from_repo_graphql_not_found(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It gives error message."""
+    session = mock_github3_login.return_value.session
+    session.post.return_value = _graphql_answer(
+        mocker, {"r0": {"pullRequests": {"nodes": []}}}
+    )
+
+    with pytest.raises(
+        gs.GithubServiceError, match=f"{REPO}: no open PR found for branch:main.\n"
+    ):
+        gs.GithubService(
+            domain_gh_conn_settings[0], [REPO]
+        ).merge_pull_request_from_repo(REPO, DOMAIN_MPR)
+
+
+def test_create_issue_from_repos(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It creates issues with one mutation document."""
+    session = mock_github3_login.return_value.session
+    session.post.side_effect = [
+        _graphql_answer(
+            mocker,
+            {
+                "r0": {"id": "repo1", "hasIssuesEnabled": True, "l0": {"id": "bug"}},
+                "r1": {"id": "repo2", "hasIssuesEnabled": False, "l0": {"id": "bug"}},
+                "r2": {"id": "repo3", "hasIssuesEnabled": True, "l0": None},
+            },
+        ),
+        _graphql_answer(mocker, {"m0": {"issue": {"number": 1}}}),
+    ]
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2, "org/new"])
+
+    outcomes = service.create_issue_from_repos(
+        [REPO, REPO2, "org/new"], i.Issue(0, "title", "body", {LABEL_BUG})
+    )
+
+    assert outcomes == {
+        REPO: f"{REPO}: create issue successful.\n",
+        REPO2: f"{REPO2}: Issues are disabled for this repo. It may be a fork.\n",
+    }
+    mutation = session.post.call_args.kwargs["json"]["query"]
+    assert mutation.startswith(
+        'mutation { m0: createIssue(input: {repositoryId: "repo1"'
+    )
+
+
+def test_close_issues_from_repos(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It closes listed issues and pull requests with their node ids."""
+    nodes = {
+        "pageInfo": {"hasNextPage": False},
+        "nodes": [
+            {
+                "id": "node1",
+                "number": 1,
+                "title": "title",
+                "body": "",
+                "state": "OPEN",
+                "createdAt": "2024-01-01T00:00:00Z",
+                "labels": {"totalCount": 0, "nodes": []},
+            }
+        ],
+    }
+    empty = {"pageInfo": {"hasNextPage": False}, "nodes": []}
+    session = mock_github3_login.return_value.session
+    session.post.side_effect = [
+        _graphql_answer(mocker, {"r0": {"issues": empty, "pullRequests": nodes}}),
+        _graphql_answer(mocker, {"m0": {}}),
+    ]
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2])
+    issues = service.list_issues_from_repo(REPO, il.IssueListValidRequest())
+
+    outcomes = service.close_issues_from_repos({REPO: issues, REPO2: []})
+
+    assert outcomes == {
+        REPO2: f"{REPO2}: no issues match.\n",
+        REPO: f"{REPO}: close issues successful.\n",
+    }
+    assert session.post.call_args.kwargs["json"]["query"] == (
+        'mutation { m0: closePullRequest(input: {pullRequestId: "node1"}) '
+        "{ clientMutationId } }"
+    )
+    assert service._listed_issues[(REPO, 1)].state == "closed"
+
+
+def test_reopen_issues_from_repos_not_listed(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It leaves issues without known node ids to REST."""
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    assert service.reopen_issues_from_repos({REPO: DOMAIN_ISSUES}) == {}
+    mock_github3_login.return_value.session.post.assert_not_called()
+
+
+def test_delete_branch_from_repos(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It deletes found branches with one mutation document."""
+    session = mock_github3_login.return_value.session
+    session.post.side_effect = [
+        _graphql_answer(mocker, {"r0": {"ref": {"id": "ref1"}}, "r1": {"ref": None}}),
+        mocker.Mock(
+            status_code=200,
+            json=mocker.Mock(
+                return_value={
+                    "data": {"m0": None},
+                    "errors": [{"message": "Forbidden", "path": ["m0"]}],
+                }
+            ),
+        ),
+    ]
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2])
+
+    outcomes = service.delete_branch_from_repos([REPO, REPO2], BRANCH_NAME)
+
+    assert outcomes[REPO2] == f"{REPO2}: Not Found.\n"
+    assert isinstance(outcomes[REPO], gs.GithubServiceError)
+    assert str(outcomes[REPO]) == f"{REPO}: Forbidden\n"
+
+
+def test_delete_branch_from_repos_mutations_unavailable(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It leaves repositories to REST when the server lacks the mutation."""
+    session = mock_github3_login.return_value.session
+    session.post.side_effect = [
+        _graphql_answer(mocker, {"r0": {"ref": {"id": "ref1"}}}),
+        mocker.Mock(
+            status_code=200,
+            json=mocker.Mock(
+                return_value={
+                    "errors": [{"message": "No deleteRef", "type": "undefinedField"}]
+                }
+            ),
+        ),
+    ]
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    assert service.delete_branch_from_repos([REPO], BRANCH_NAME) == {}
+
+
+def test_preflight_pull_requests(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It reports repositories where the pull request cannot be created."""
+    repos = [REPO, REPO2, "org/no-head", "org/ok"]
+    mock_github3_login.return_value.session.post.return_value = _graphql_answer(
+        mocker,
+        {
+            "r0": {"base": {"compare": {"aheadBy": 0}}, "head": {"id": "1"}},
+            "r1": {"base": None, "head": {"id": "2"}},
+            "r2": {"base": {"compare": None}, "head": None},
+            "r3": {"base": {"compare": {"aheadBy": 1}}, "head": {"id": "3"}},
+        },
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0], repos)
+
+    reasons = service.preflight_pull_requests(repos, "main", "branch")
+
+    assert reasons == {
+        REPO: f"{REPO}: No commits between main and branch.\n",
+        REPO2: f"{REPO2}: base branch main not found.\n",
+        "org/no-head": "org/no-head: head branch branch not found.\n",
+    }
+    mock_github3_login.return_value.session.post.assert_called_once()
+
+
+def test_preflight_merges(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It reports repositories without a pull request to merge."""
+    pull = {"id": "pr1", "number": 7, "headRepositoryOwner": {"login": "org name"}}
+    mock_github3_login.return_value.session.post.return_value = _graphql_answer(
+        mocker,
+        {
+            "r0": {"pullRequests": {"nodes": [pull]}},
+            "r1": {"pullRequests": {"nodes": []}},
+        },
+    )
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO, REPO2])
+
+    assert service.preflight_merges([REPO, REPO2], DOMAIN_MPR) == {
+        REPO2: f"{REPO2}: no open PR found for branch:main.\n"
+    }
+
+
+def test_get_repo_lists_repositories_once(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists repositories once for all lookups."""
+    service = gs.GithubService(domain_gh_conn_settings[0])
+    service.get_repo_url(REPO)
+    service.get_repo_url(REPO2)
+    service.get_repo_names()
+    service._get_repo(REPO)
+
+    mock_github3_login.return_value.repositories.assert_called_once()
+
+
+def test_get_repo_selected_repos(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It fetches only selected repositories without listing the account."""
+    repo = mocker.Mock(full_name=REPO)
+    connection = mock_github3_login.return_value
+    connection.repository.return_value = repo
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    assert service._get_repo(REPO) == repo
+    assert service.get_repo_url(REPO) == f"git@github.com:{REPO}.git"
+    connection.repository.assert_called_once_with("org", "repo-name")
+    connection.repositories.assert_not_called()
+
+
+def test_get_repo_selected_repos_not_found(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It raises NameError for selected repositories that do not exist."""
+    mock_github3_login.return_value.repository.return_value = None
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO])
+
+    with pytest.raises(NameError):
+        service._get_repo(REPO)
+
+
+def test_get_repo_selected_repos_forbidden(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It fails only lookups of a forbidden repository, resolving all once."""
+    exception_mock = mocker.Mock()
+    exception_mock.json.return_value.get.return_value = "SAML enforcement"
+    repos = {REPO: mocker.Mock(full_name=REPO)}
+
+    def repository(owner: str, name: str) -> MockerFixture:
+        if f"{owner}/{name}" == REPO2:
+            raise github3.exceptions.ForbiddenError(exception_mock)
+        return repos[f"{owner}/{name}"]
+
+    connection = mock_github3_login.return_value
+    connection.repository.side_effect = repository
+    service = gs.GithubService(domain_gh_conn_settings[0], [REPO2, REPO])
+
+    for _ in range(2):
+        with pytest.raises(gs.GithubServiceError, match=f"{REPO2}: SAML"):
+            service.get_repo_url(REPO2)
+        assert service.get_repo_url(REPO) == f"git@github.com:{REPO}.git"
+    assert connection.repository.call_count == 2
+
+
+def test_get_repo_names_selected_repos(
+    domain_gh_conn_settings: list[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It lists all repositories to choose from."""
+    result = gs.GithubService(domain_gh_conn_settings[0], [REPO]).get_repo_names()
+
+    assert result == [REPO2, REPO]
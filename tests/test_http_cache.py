@@ -0,0 +1,169 @@
+"""Test cases for the HTTP cache module."""
+from __future__ import annotations
+
+import io
+import os
+import pathlib
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import git_portfolio.http_cache as hc
+
+
+URL = "https://api.github.com/repos/org/repo-name/issues"
+
+
+def _prepare(
+    method: str = "GET", token: str = "token abc"
+) -> requests.PreparedRequest:
+    """Return prepared request."""
+    return requests.Request(method, URL, headers={"Authorization": token}).prepare()
+
+
+def _response(
+    status_code: int, content: bytes = b"", headers: dict[str, str] | None = None
+) -> requests.Response:
+    """Return response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = URL
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.raw = io.BytesIO(content)
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def mock_send(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking the network send of requests."""
+    return mocker.patch("requests.adapters.HTTPAdapter.send")
+
+
+def test_init_default_folder(mocker: MockerFixture) -> None:
+    """It uses the gitp folder at user home."""
+    mocker.patch("os.path.expanduser", return_value="/home/user")
+
+    assert hc.HttpCache().cache_folder == os.path.join("/home/user", ".gitp", "cache")
+
+
+def test_key_depends_on_token() -> None:
+    """It does not share entries across tokens."""
+    assert hc.HttpCache.key(_prepare()) == hc.HttpCache.key(_prepare())
+    assert hc.HttpCache.key(_prepare()) != hc.HttpCache.key(
+        _prepare(token="token other")
+    )
+
+
+def test_get_missing(tmp_path: pathlib.Path) -> None:
+    """It returns None."""
+    assert hc.HttpCache(str(tmp_path)).get("key") is None
+
+
+def test_put_get(tmp_path: pathlib.Path) -> None:
+    """It returns stored entry."""
+    cache = hc.HttpCache(str(tmp_path))
+    cache.put("key", {"etag": "abc"})
+
+    assert cache.get("key") == {"etag": "abc"}
+
+
+def test_put_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    """It removes entries not read for the longest time."""
+    cache = hc.HttpCache(str(tmp_path), max_size=60)
+    cache.put("first", {"content": "x" * 10})
+    cache.put("second", {"content": "x" * 10})
+    os.utime(tmp_path / "first.json", ns=(1, 1))
+    os.utime(tmp_path / "second.json", ns=(1, 1))
+    cache.get("first")
+    cache.put("third", {"content": "x" * 10})
+
+    assert cache.get("first") is not None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+
+
+def test_put_scans_only_when_over_max_size(
+    mocker: MockerFixture, tmp_path: pathlib.Path
+) -> None:
+    """It keeps entry sizes in memory and reads the folder once until full."""
+    cache = hc.HttpCache(str(tmp_path), max_size=100)
+    scan = mocker.spy(cache, "_scan")
+    for number in range(3):
+        cache.put(f"entry{number}", {"content": "x" * 10})
+
+    assert scan.call_count == 1
+
+    cache.put("entry3", {"content": "x" * 10})
+    cache.put("entry4", {"content": "x" * 10})
+
+    assert scan.call_count == 2
+    assert len(list(tmp_path.glob("*.json"))) == 3
+    assert cache._total == 75
+
+
+def test_send_stores_response_with_etag(
+    tmp_path: pathlib.Path, mock_send: MockerFixture
+) -> None:
+    """It stores response and replays its ETag on next request."""
+    mock_send.return_value = _response(200, b"[]", {"ETag": '"abc"'})
+    adapter = hc.CachingAdapter(hc.HttpCache(str(tmp_path)))
+    adapter.send(_prepare())
+    request = _prepare()
+    mock_send.return_value = _response(200, b"[1]", {"ETag": '"def"'})
+    response = adapter.send(request)
+
+    assert request.headers["If-None-Match"] == '"abc"'
+    assert response.content == b"[1]"
+
+
+def test_send_not_modified(tmp_path: pathlib.Path, mock_send: MockerFixture) -> None:
+    """It returns stored content with fresh headers."""
+    mock_send.return_value = _response(
+        200,
+        b"[]",
+        {
+            "ETag": '"abc"',
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "X-RateLimit-Remaining": "10",
+        },
+    )
+    adapter = hc.CachingAdapter(hc.HttpCache(str(tmp_path)))
+    adapter.send(_prepare())
+    request = _prepare()
+    mock_send.return_value = _response(304, headers={"X-RateLimit-Remaining": "9"})
+    response = adapter.send(request)
+
+    assert request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert response.status_code == 200
+    assert response.content == b"[]"
+    assert response.headers["X-RateLimit-Remaining"] == "9"
+
+
+def test_send_without_validators(
+    tmp_path: pathlib.Path, mock_send: MockerFixture
+) -> None:
+    """It does not store response."""
+    mock_send.return_value = _response(200, b"[]")
+    adapter = hc.CachingAdapter(hc.HttpCache(str(tmp_path)))
+    adapter.send(_prepare())
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_send_not_get(tmp_path: pathlib.Path, mock_send: MockerFixture) -> None:
+    """It does not store response."""
+    mock_send.return_value = _response(200, b"{}", {"ETag": '"abc"'})
+    adapter = hc.CachingAdapter(hc.HttpCache(str(tmp_path)))
+    adapter.send(_prepare("PATCH"))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_mount() -> None:
+    """It mounts caching adapter for HTTPS."""
+    session = requests.Session()
+    hc.mount(session, hc.HttpCache("/tmp/cache"))
+
+    assert isinstance(session.get_adapter(URL), hc.CachingAdapter)
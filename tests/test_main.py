@@ -1,12 +1,18 @@
 """Test cases for the __main__ module."""
 from __future__ import annotations
 
+import os
+import pathlib
+import subprocess  # nosec
+import sys
+
 import click
 import pytest
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
 
 import git_portfolio.__main__
+import git_portfolio.domain.clone_options as co
 import git_portfolio.github_service as gs
 import git_portfolio.responses as res
 from tests.conftest import CLI_COMMAND
@@ -34,16 +40,6 @@ def mock_github_service(mocker: MockerFixture) -> MockerFixture:
     return mocker.patch("git_portfolio.github_service.GithubService", autospec=True)
 
 
-@pytest.fixture
-def mock_github_service_error(mocker: MockerFixture) -> MockerFixture:
-    """Fixture for mocking GithubService with error."""
-    return mocker.patch(
-        "git_portfolio.github_service.GithubService",
-        autospec=True,
-        side_effect=gs.GithubServiceError,
-    )
-
-
 @pytest.fixture
 def mock_config_init_use_case(mocker: MockerFixture) -> MockerFixture:
     """Fixture for mocking ConfigInitUseCase."""
@@ -144,6 +140,48 @@ def mock_prompt_inquirer_prompter(mocker: MockerFixture) -> MockerFixture:
     return mocker.patch("git_portfolio.prompt.InquirerPrompter", autospec=True)
 
 
+def _loaded_heavy_modules(args: list[str], home: pathlib.Path) -> str:
+    """Run CLI in a new interpreter and return which heavy modules it loaded."""
+    code = (
+        "import sys\n"
+        "from git_portfolio.__main__ import main\n"
+        "try:\n"
+        f"    main({args!r}, prog_name='gitp')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('github3', 'inquirer', 'requests', 'yaml')\n"
+        "print('loaded:', *[name for name in heavy if name in sys.modules])\n"
+    )
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "HOME": str(home)},
+    )
+    return result.stdout.decode().splitlines()[-1]
+
+
+@pytest.mark.parametrize("args", [["--help"], ["status"], ["poetry", "install"]])
+def test_local_commands_import_budget(args: list[str], tmp_path: pathlib.Path) -> None:
+    """It does not import GitHub client and prompt stacks for local commands."""
+    assert _loaded_heavy_modules(args, tmp_path) == "loaded:"
+
+
+def test_local_commands_import_budget_cached_config(tmp_path: pathlib.Path) -> None:
+    """It does not import YAML parser once the config cache is built."""
+    config_folder = tmp_path / ".gitp"
+    config_folder.mkdir()
+    (config_folder / "config.yaml").write_text(
+        "github_access_token: token\n"
+        "github_hostname: ''\n"
+        "github_selected_repos:\n"
+        " - user/test\n"
+    )
+
+    assert _loaded_heavy_modules(["status"], tmp_path) == "loaded: yaml"
+    assert _loaded_heavy_modules(["status"], tmp_path) == "loaded:"
+
+
 def test_command_config_check_success(
     mock_config_manager: MockerFixture, runner: CliRunner
 ) -> None:
@@ -199,6 +237,20 @@ def test_add_success(
     )
 
 
+def test_jobs_option(
+    mock_git_use_case: MockerFixture,
+    mock_config_manager: MockerFixture,
+    runner: CliRunner,
+) -> None:
+    """It passes the number of jobs to the use case."""
+    runner.invoke(
+        git_portfolio.__main__.main, ["--jobs", "4", "fetch"], prog_name=CLI_COMMAND
+    )
+
+    mock_git_use_case.assert_called_once_with(4)
+    mock_git_use_case.return_value.execute.assert_called_once_with([REPO], "fetch", ())
+
+
 def test_branch_success(
     mock_git_use_case: MockerFixture,
     mock_config_manager: MockerFixture,
@@ -603,11 +655,14 @@ def test_config_repos_do_not_change(
 
 def test_config_repos_service_error(
     mock_prompt_inquirer_prompter: MockerFixture,
-    mock_github_service_error: MockerFixture,
+    mock_github_service: MockerFixture,
     mock_config_manager: MockerFixture,
     runner: CliRunner,
 ) -> None:
     """It raises system exit."""
+    mock_github_service.return_value.get_repo_names.side_effect = (
+        gs.GithubServiceError
+    )
     mock_config_manager.config_is_empty.return_value = False
     mock_prompt_inquirer_prompter.new_repos.return_value = True
     result = runner.invoke(
@@ -618,6 +673,7 @@ def test_config_repos_service_error(
 
 
 def test_clone_success(
+    mocker: MockerFixture,
     mock_git_clone_use_case: MockerFixture,
     mock_github_service: MockerFixture,
     mock_config_manager: MockerFixture,
@@ -625,22 +681,66 @@ def test_clone_success(
 ) -> None:
     """It calls git clone."""
     github_service = mock_github_service.return_value
-    runner.invoke(git_portfolio.__main__.main, ["clone"], prog_name=CLI_COMMAND)
+    mock_git_clone_use_case.return_value.execute_as_completed.return_value = iter(
+        [res.ResponseSuccess("clone output")]
+    )
+    result = runner.invoke(
+        git_portfolio.__main__.main, ["clone", "--jobs", "16"], prog_name=CLI_COMMAND
+    )
 
-    mock_git_clone_use_case(github_service).execute.assert_called_once_with([REPO])
+    mock_github_service.assert_called_once_with(mocker.ANY, [REPO])
+    mock_git_clone_use_case.assert_called_once_with(
+        github_service, 16, co.CloneOptions()
+    )
+    mock_git_clone_use_case(
+        github_service
+    ).execute_as_completed.assert_called_once_with([REPO])
+    assert result.output == "clone output\n"
 
 
-def test_clone_service_error(
-    mock_github_service_error: MockerFixture,
+def test_clone_with_options(
+    mock_git_clone_use_case: MockerFixture,
+    mock_github_service: MockerFixture,
     mock_config_manager: MockerFixture,
     runner: CliRunner,
 ) -> None:
-    """It raises system exit."""
-    result = runner.invoke(
-        git_portfolio.__main__.main, ["clone"], prog_name=CLI_COMMAND
+    """It calls git clone with shallow and partial clone options."""
+    github_service = mock_github_service.return_value
+    runner.invoke(
+        git_portfolio.__main__.main,
+        [
+            "clone",
+            "--depth",
+            "1",
+            "--filter",
+            "tree:0",
+            "--single-branch",
+            "--reference-cache",
+            "--existing",
+            "fetch",
+        ],
+        prog_name=CLI_COMMAND,
     )
 
-    assert type(result.exception) == SystemExit
+    mock_git_clone_use_case.assert_called_once_with(
+        github_service, 8, co.CloneOptions(1, "tree:0", True, True, "fetch")
+    )
+
+
+def test_clone_root_jobs(
+    mock_git_clone_use_case: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_config_manager: MockerFixture,
+    runner: CliRunner,
+) -> None:
+    """It uses the root jobs option when clone has none."""
+    runner.invoke(
+        git_portfolio.__main__.main, ["--jobs", "4", "clone"], prog_name=CLI_COMMAND
+    )
+
+    mock_git_clone_use_case.assert_called_once_with(
+        mock_github_service.return_value, 4, co.CloneOptions()
+    )
 
 
 def test_create_issues(
@@ -662,19 +762,6 @@ def test_create_issues(
     ).execute.assert_called_once()
 
 
-def test_create_issues_service_error(
-    mock_github_service_error: MockerFixture,
-    mock_config_manager: MockerFixture,
-    runner: CliRunner,
-) -> None:
-    """It raises system exit."""
-    result = runner.invoke(
-        git_portfolio.__main__.group_issues, ["create"], prog_name=CLI_COMMAND
-    )
-
-    assert type(result.exception) == SystemExit
-
-
 @pytest.mark.parametrize(
     "cli", [git_portfolio.__main__.group_issues, git_portfolio.__main__.group_prs]
 )
@@ -691,26 +778,12 @@ def test_close_issues(
     github_service = mock_github_service.return_value
     runner.invoke(cli, ["close"], prog_name=CLI_COMMAND)
 
+    github_service.warm_up.assert_called_once_with(("open",))
     mock_gh_close_issue_use_case(
         config_manager, github_service
     ).execute.assert_called_once()
 
 
-@pytest.mark.parametrize(
-    "cli", [git_portfolio.__main__.group_issues, git_portfolio.__main__.group_prs]
-)
-def test_close_issues_service_error(
-    cli: click.core.BaseCommand,
-    mock_github_service_error: MockerFixture,
-    mock_config_manager: MockerFixture,
-    runner: CliRunner,
-) -> None:
-    """It raises system exit."""
-    result = runner.invoke(cli, ["close"], prog_name=CLI_COMMAND)
-
-    assert type(result.exception) == SystemExit
-
-
 @pytest.mark.parametrize(
     "cli", [git_portfolio.__main__.group_issues, git_portfolio.__main__.group_prs]
 )
@@ -727,26 +800,12 @@ def test_reopen_issues(
     github_service = mock_github_service.return_value
     runner.invoke(cli, ["reopen"], prog_name=CLI_COMMAND)
 
+    github_service.warm_up.assert_called_once_with(("closed",))
     mock_gh_reopen_issue_use_case(
         config_manager, github_service
     ).execute.assert_called_once()
 
 
-@pytest.mark.parametrize(
-    "cli", [git_portfolio.__main__.group_issues, git_portfolio.__main__.group_prs]
-)
-def test_reopen_issues_service_error(
-    cli: click.core.BaseCommand,
-    mock_github_service_error: MockerFixture,
-    mock_config_manager: MockerFixture,
-    runner: CliRunner,
-) -> None:
-    """It raises system exit."""
-    result = runner.invoke(cli, ["reopen"], prog_name=CLI_COMMAND)
-
-    assert type(result.exception) == SystemExit
-
-
 def test_create_prs(
     mock_gh_create_pr_use_case: MockerFixture,
     mock_github_service: MockerFixture,
@@ -759,24 +818,12 @@ def test_create_prs(
     github_service = mock_github_service.return_value
     runner.invoke(git_portfolio.__main__.group_prs, ["create"], prog_name=CLI_COMMAND)
 
+    github_service.warm_up.assert_called_once_with(("open",))
     mock_gh_create_pr_use_case(
         config_manager, github_service
     ).execute.assert_called_once()
 
 
-def test_create_prs_service_error(
-    mock_github_service_error: MockerFixture,
-    mock_config_manager: MockerFixture,
-    runner: CliRunner,
-) -> None:
-    """It raises system exit."""
-    result = runner.invoke(
-        git_portfolio.__main__.group_prs, ["create"], prog_name=CLI_COMMAND
-    )
-
-    assert type(result.exception) == SystemExit
-
-
 def test_merge_prs(
     mock_gh_merge_pr_use_case: MockerFixture,
     mock_github_service: MockerFixture,
@@ -795,11 +842,14 @@ def test_merge_prs(
 
 
 def test_merge_prs_service_error(
-    mock_github_service_error: MockerFixture,
+    mock_github_service: MockerFixture,
     mock_config_manager: MockerFixture,
     runner: CliRunner,
 ) -> None:
     """It raises system exit."""
+    mock_github_service.return_value.get_username.side_effect = (
+        gs.GithubServiceError
+    )
     result = runner.invoke(
         git_portfolio.__main__.group_prs, ["merge"], prog_name=CLI_COMMAND
     )
@@ -824,16 +874,3 @@ def test_delete_branches(
     mock_gh_delete_branch_use_case(
         config_manager, github_service
     ).execute.assert_called_once()
-
-
-def test_delete_branches_service_error(
-    mock_github_service_error: MockerFixture,
-    mock_config_manager: MockerFixture,
-    runner: CliRunner,
-) -> None:
-    """It raises system exit."""
-    result = runner.invoke(
-        git_portfolio.__main__.group_branches, ["delete"], prog_name=CLI_COMMAND
-    )
-
-    assert type(result.exception) == SystemExit
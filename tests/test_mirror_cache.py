@@ -0,0 +1,81 @@
+"""Test cases for the mirror cache module."""
+import os
+import pathlib
+
+import pytest
+from pytest_mock import MockerFixture
+
+import git_portfolio.mirror_cache as mc
+from tests.conftest import ERROR_MSG
+from tests.conftest import REPO
+
+
+@pytest.fixture
+def mock_popen(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking subprocess.Popen."""
+    mock = mocker.patch("subprocess.Popen")
+    mock.return_value.returncode = 0
+    mock.return_value.communicate.return_value = (b"", b"")
+    return mock
+
+
+def test_init_default_folder(mocker: MockerFixture) -> None:
+    """It uses the gitp folder at user home."""
+    mocker.patch("os.path.expanduser", return_value="/home/user")
+
+    assert mc.MirrorCache().cache_folder == os.path.join(
+        "/home/user", ".gitp", "mirrors"
+    )
+
+
+def test_mirror_path(tmp_path: pathlib.Path) -> None:
+    """It returns a bare repo path for the repo."""
+    result = mc.MirrorCache(str(tmp_path)).mirror_path(REPO)
+
+    assert result == os.path.join(str(tmp_path), f"{REPO}.git")
+
+
+def test_refresh_new_mirror(
+    tmp_path: pathlib.Path, mock_popen: MockerFixture
+) -> None:
+    """It creates a mirror clone."""
+    cache = mc.MirrorCache(str(tmp_path))
+    result = cache.refresh(REPO, "git@github.com:org/repo-name.git")
+
+    assert result == ""
+    assert mock_popen.call_args.args[0] == [
+        "git",
+        "clone",
+        "--mirror",
+        "git@github.com:org/repo-name.git",
+        cache.mirror_path(REPO),
+    ]
+    assert (tmp_path / "org").is_dir()
+
+
+def test_refresh_existing_mirror(
+    tmp_path: pathlib.Path, mock_popen: MockerFixture
+) -> None:
+    """It fetches new objects into existing mirror."""
+    cache = mc.MirrorCache(str(tmp_path))
+    pathlib.Path(cache.mirror_path(REPO)).mkdir(parents=True)
+    result = cache.refresh(REPO, "git@github.com:org/repo-name.git")
+
+    assert result == ""
+    assert mock_popen.call_args.args[0] == [
+        "git",
+        "--git-dir",
+        cache.mirror_path(REPO),
+        "remote",
+        "update",
+        "--prune",
+    ]
+
+
+def test_refresh_error(tmp_path: pathlib.Path, mock_popen: MockerFixture) -> None:
+    """It returns git error output."""
+    mock_popen.return_value.returncode = 128
+    mock_popen.return_value.communicate.return_value = (b"", ERROR_MSG.encode())
+    result = mc.MirrorCache(str(tmp_path)).refresh(REPO, "url")
+
+    assert result == ERROR_MSG
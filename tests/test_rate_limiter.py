@@ -0,0 +1,321 @@
+"""Test cases for the rate limiter module against a local stub server."""
+from __future__ import annotations
+
+import http.server
+import json
+import threading
+import time
+from typing import Any
+from typing import Iterator
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+import git_portfolio.rate_limiter as rl
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    """Server answering queued responses, then 200."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Listen on a free local port."""
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.answers: list[tuple[int, dict[str, str], Any]] = []
+        self.hits = 0
+
+    @property
+    def url(self) -> str:
+        """Return root URL."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler of StubServer."""
+
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Answer next queued response."""
+        self.server.hits += 1
+        status, headers, body = (
+            self.server.answers.pop(0)
+            if self.server.answers
+            else (200, {}, {"login": "staticdev"})
+        )
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_POST = do_GET  # noqa: N815
+
+    def log_message(self, *_: Any) -> None:
+        """Keep test output clean."""
+
+
+@pytest.fixture
+def server() -> Iterator[StubServer]:
+    """Fixture for a running stub server."""
+    stub = StubServer()
+    thread = threading.Thread(
+        target=stub.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def _session(limiter: rl.RateLimiter) -> requests.Session:
+    """Return session scheduled by limiter."""
+    session = requests.Session()
+    session.mount("http://", rl.RateLimitAdapter(limiter))
+    return session
+
+
+def test_acquire_burst_then_rate() -> None:
+    """It lets a burst through and paces the next requests."""
+    limiter = rl.RateLimiter(rate=10, burst=2)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_update_retry_after() -> None:
+    """It pauses every worker for Retry-After seconds."""
+    limiter = rl.RateLimiter()
+
+    delay = limiter.update(429, {"Retry-After": "30"})
+
+    assert delay == 30
+    assert limiter.acquire() == pytest.approx(30, abs=0.1)
+
+
+def test_update_primary_limit_exhausted(mocker: MockerFixture) -> None:
+    """It waits until the quota resets."""
+    mocker.patch("time.time", return_value=1000.0)
+    limiter = rl.RateLimiter()
+
+    delay = limiter.update(
+        403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1100"}
+    )
+
+    assert delay == 100
+
+
+def test_update_secondary_limit() -> None:
+    """It waits the secondary limit default."""
+    limiter = rl.RateLimiter(secondary_wait=5)
+
+    delay = limiter.update(403, {}, "You have exceeded a secondary rate limit.")
+
+    assert delay == 5
+
+
+def test_update_forbidden() -> None:
+    """It does not retry other forbidden responses."""
+    assert rl.RateLimiter().update(403, {}, "Resource not accessible") is None
+
+
+def test_acquire_unpaced_by_default() -> None:
+    """It does not cap requests while quotas are unknown."""
+    limiter = rl.RateLimiter(burst=2)
+
+    assert [limiter.acquire() for _ in range(100)] == [0.0] * 100
+
+
+def test_update_healthy_quota_not_paced(mocker: MockerFixture) -> None:
+    """It does not slow down while most of the quota is left."""
+    mocker.patch("time.time", return_value=1000.0)
+    limiter = rl.RateLimiter()
+    headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": "4600",
+    }
+
+    for _ in range(400):
+        limiter.update(200, headers)
+        assert limiter.acquire() == 0.0
+
+
+def test_update_spreads_low_quota(mocker: MockerFixture) -> None:
+    """It slows down so a low remaining quota lasts until reset."""
+    mocker.patch("time.time", return_value=1000.0)
+    limiter = rl.RateLimiter(burst=1)
+
+    limiter.update(
+        200,
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "50",
+            "X-RateLimit-Reset": "1100",
+        },
+    )
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(2, abs=0.01)
+
+
+def test_update_resources_apart(mocker: MockerFixture) -> None:
+    """It paces and pauses each rate limit resource on its own."""
+    mocker.patch("time.time", return_value=1000.0)
+    limiter = rl.RateLimiter(burst=1)
+
+    delay = limiter.update(
+        403,
+        {
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "1060",
+            "X-RateLimit-Resource": "search",
+        },
+    )
+
+    assert delay == 60
+    assert limiter.acquire("search") == pytest.approx(60, abs=0.1)
+    assert limiter.acquire("core") == 0.0
+    assert limiter.acquire("core") == 0.0
+
+
+def test_resource_of() -> None:
+    """It tells the resource from the request URL."""
+    assert rl.resource_of("https://api.github.com/search/issues?q=x") == "search"
+    assert rl.resource_of("https://myhost.com/api/graphql") == "graphql"
+    assert rl.resource_of("https://api.github.com/repos/org/repo") == "core"
+
+
+def test_mutation_lane_spacing() -> None:
+    """It spaces out mutation slots."""
+    lane = rl.MutationLane(spacing=1)
+
+    waits = [lane.reserve() for _ in range(3)]
+
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(1, abs=0.01)
+    assert waits[2] == pytest.approx(2, abs=0.01)
+
+
+def test_mutation_lane_adaptive_backoff() -> None:
+    """It doubles spacing when limited and recovers on success."""
+    lane = rl.MutationLane(spacing=1, max_spacing=3)
+
+    lane.record(True)
+    assert lane.current_spacing == 2
+    lane.record(True)
+    assert lane.current_spacing == 3
+    lane.record(False)
+    assert lane.current_spacing == 2
+    lane.record(False)
+    lane.record(False)
+    assert lane.current_spacing == pytest.approx(1.25)
+
+
+def test_is_mutation() -> None:
+    """It sends GraphQL queries as reads and GraphQL mutations as mutations."""
+    url = "https://api.github.com/graphql"
+
+    assert not rl.is_mutation("GET", "https://api.github.com/user")
+    assert rl.is_mutation("PATCH", "https://api.github.com/repos/org/repo")
+    assert not rl.is_mutation("POST", url, json.dumps({"query": "query { a }"}))
+    assert not rl.is_mutation("POST", url, b'{"query": "{ a }"}')
+    assert rl.is_mutation("POST", url, json.dumps({"query": "mutation { a }"}))
+
+
+def test_mutation_cost() -> None:
+    """It counts every mutation of a GraphQL document."""
+    url = "https://api.github.com/graphql"
+    document = (
+        'mutation { m0: createIssue(input: {title: "a { b"}) { issue { number } } '
+        'm1: deleteRef(input: {refId: "r"}) { clientMutationId } }'
+    )
+
+    assert rl.mutation_cost("POST", url, json.dumps({"query": document})) == 2
+    assert rl.mutation_cost("POST", url, json.dumps({"query": "query { a }"})) == 0
+    assert rl.mutation_cost("DELETE", "https://api.github.com/repos/org/r") == 1
+
+
+def test_mutation_lane_reserve_many() -> None:
+    """It keeps a slot for each mutation of a request."""
+    lane = rl.MutationLane(spacing=1)
+
+    assert lane.reserve(3) == 0.0
+    assert lane.reserve() == pytest.approx(3, abs=0.01)
+
+
+def test_adapter_graphql_limited_backoff(server: StubServer) -> None:
+    """It widens mutation spacing after rate limited GraphQL mutations."""
+    server.answers = [
+        (200, {}, {"errors": [{"message": "secondary rate limit", "path": ["m0"]}]})
+    ]
+    limiter = rl.RateLimiter(mutation_spacing=0.01)
+    session = _session(limiter)
+
+    session.post(
+        f"{server.url}/graphql", json={"query": "mutation { m0: a(x: 1) { b } }"}
+    )
+
+    assert limiter.mutations.current_spacing > 0.01
+
+
+def test_adapter_serializes_mutations(server: StubServer) -> None:
+    """It sends mutations one at a time with spacing between them."""
+    session = _session(rl.RateLimiter(mutation_spacing=0.05))
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=session.post, args=(server.url,)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert server.hits == 4
+    assert time.monotonic() - start >= 0.15
+
+
+def test_adapter_mutation_backoff(server: StubServer) -> None:
+    """It widens mutation spacing after a secondary limit."""
+    server.answers = [(403, {"Retry-After": "0"}, {"message": "secondary rate limit"})]
+    limiter = rl.RateLimiter(mutation_spacing=0.01)
+
+    response = _session(limiter).post(server.url)
+
+    assert response.status_code == 200
+    assert limiter.mutations.current_spacing > 0.01
+
+
+def test_adapter_retries_after_limit(server: StubServer) -> None:
+    """It pauses and sends the request again."""
+    server.answers = [
+        (429, {"Retry-After": "0.2"}, {"message": "slow down"}),
+        (403, {"Retry-After": "0"}, {"message": "secondary rate limit"}),
+    ]
+    start = time.monotonic()
+
+    response = _session(rl.RateLimiter()).get(server.url)
+
+    assert response.status_code == 200
+    assert server.hits == 3
+    assert time.monotonic() - start >= 0.2
+
+
+def test_adapter_gives_up(server: StubServer) -> None:
+    """It returns the limited response after max retries."""
+    server.answers = [(429, {"Retry-After": "0"}, {})] * 3
+    limiter = rl.RateLimiter(max_retries=2)
+
+    response = _session(limiter).get(server.url)
+
+    assert response.status_code == 429
+    assert server.hits == 3
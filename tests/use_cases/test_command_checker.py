@@ -1,32 +1,59 @@
 """Test cases for the command checker use case."""
+from typing import Iterator
+
 import pytest
 from pytest_mock import MockerFixture
 
 import git_portfolio.use_cases.command_checker as command_checker
 
 
+@pytest.fixture(autouse=True)
+def clear_resolved_cache() -> Iterator[None]:
+    """Fixture for clearing cache of resolved executables."""
+    command_checker._RESOLVED.clear()
+    yield
+    command_checker._RESOLVED.clear()
+
+
 @pytest.fixture
-def mock_popen(mocker: MockerFixture) -> MockerFixture:
-    """Fixture for mocking subprocess.Popen."""
-    mock = mocker.patch("subprocess.Popen")
-    mock.return_value.returncode = 0
-    mock.return_value.communicate.return_value = (b"some output", b"")
-    return mock
+def mock_which(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking shutil.which."""
+    return mocker.patch("shutil.which", return_value="/usr/bin/program")
 
 
-def test_check_command_installed_success(mock_popen: MockerFixture) -> None:
+def test_check_command_installed_success(mock_which: MockerFixture) -> None:
     """It returns success."""
     response = command_checker.CommandChecker().check("program")
 
     assert "" == response
 
 
-def test_check_command_installed_error(mock_popen: MockerFixture) -> None:
+def test_check_command_installed_error(mock_which: MockerFixture) -> None:
     """It returns failure with git not installed message."""
-    mock_popen.side_effect = FileNotFoundError
+    mock_which.return_value = None
     response = command_checker.CommandChecker().check("program")
 
     assert (
         "This command requires program executable installed and on system path."
         == response
     )
+
+
+def test_check_command_cached(mock_which: MockerFixture) -> None:
+    """It looks up the executable only once."""
+    command_checker.CommandChecker().check("program")
+    command_checker.CommandChecker().check("program")
+
+    mock_which.assert_called_once()
+
+
+def test_check_command_path_changed(
+    mock_which: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It looks up the executable again when system path changes."""
+    monkeypatch.setenv("PATH", "/bin")
+    command_checker.CommandChecker().check("program")
+    monkeypatch.setenv("PATH", "/usr/bin")
+    command_checker.CommandChecker().check("program")
+
+    assert mock_which.call_count == 2
@@ -3,6 +3,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 import git_portfolio.domain.gh_connection_settings as cs
+import git_portfolio.github_service as gs
 import git_portfolio.responses as res
 import git_portfolio.use_cases.config_init as ci
 
@@ -61,38 +62,43 @@ def test_execute_success(
     assert "gitp successfully configured." == response.value
 
 
-def test_execute_attribute_error(
+def test_execute_connection_error(
     mock_config_manager: MockerFixture,
     mock_github_service: MockerFixture,
     mock_prompt_inquirer_prompter: MockerFixture,
     domain_gh_conn_settings: cs.GhConnectionSettings,
     mock_config_repos_use_case: MockerFixture,
 ) -> None:
-    """It returns success."""
+    """It returns failure when listing repositories cannot connect."""
     config_manager = mock_config_manager.return_value
-    mock_github_service.side_effect = AttributeError("msg")
+    mock_github_service.return_value.get_repo_names.side_effect = ConnectionError
     response = ci.ConfigInitUseCase(config_manager).execute(domain_gh_conn_settings)
 
     assert isinstance(response, res.ResponseFailure)
-    assert response.type == res.ResponseTypes.PARAMETERS_ERROR
-    assert response.value["message"] == "msg"
+    assert response.type == res.ResponseTypes.SYSTEM_ERROR
+    assert (
+        response.value["message"]
+        == "impossible to connect, please check your hostname address and token."
+    )
 
 
-def test_execute_connection_error(
+def test_execute_github_service_error(
     mock_config_manager: MockerFixture,
     mock_github_service: MockerFixture,
     mock_prompt_inquirer_prompter: MockerFixture,
     domain_gh_conn_settings: cs.GhConnectionSettings,
     mock_config_repos_use_case: MockerFixture,
 ) -> None:
-    """It returns success."""
+    """It returns failure with the connection error."""
     config_manager = mock_config_manager.return_value
-    mock_github_service.side_effect = ConnectionError
+    mock_github_service.return_value.get_repo_names.side_effect = (
+        gs.GithubServiceError("Wrong GitHub permissions. Please check your token.")
+    )
     response = ci.ConfigInitUseCase(config_manager).execute(domain_gh_conn_settings)
 
     assert isinstance(response, res.ResponseFailure)
-    assert response.type == res.ResponseTypes.SYSTEM_ERROR
+    assert response.type == res.ResponseTypes.PARAMETERS_ERROR
     assert (
         response.value["message"]
-        == "impossible to connect, please check your hostname address and token."
+        == "Wrong GitHub permissions. Please check your token."
     )
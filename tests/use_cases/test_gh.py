@@ -1,12 +1,17 @@
 """Test Github use case error handling."""
 from __future__ import annotations
 
+import threading
+
 import pytest
 from pytest_mock import MockerFixture
 
 import git_portfolio.domain.config as c
+import git_portfolio.github_service as gs
+import git_portfolio.request_objects.issue_list as il
 import git_portfolio.responses as res
 import git_portfolio.use_cases.gh as gh
+from tests.conftest import DOMAIN_ISSUES
 from tests.conftest import ERROR_MSG
 from tests.conftest import REPO
 from tests.conftest import REPO2
@@ -22,6 +27,29 @@ class FakeGhUseCase(gh.GhUseCase):
         self.call_github_service("fake_success", github_repo)
 
 
+class OrderGhUseCase(gh.GhUseCase):
+    """Github use case where the first repo finishes last."""
+
+    second_done = threading.Event()
+
+    def action(self, github_repo: str) -> None:  # type: ignore[override]
+        """Append two responses per repo."""
+        if github_repo == REPO:
+            assert self.second_done.wait(timeout=5)
+        self.responses.append(res.ResponseSuccess(f"{github_repo} 1"))
+        self.call_github_service("fake_success", github_repo)
+        if github_repo == REPO2:
+            self.second_done.set()
+
+
+class BatchGhUseCase(FakeGhUseCase):
+    """Github fake use case batching the first repo."""
+
+    def batch(self, github_repos: list[str]) -> dict[str, list[res.Response]]:
+        """Batch the first repo only."""
+        return self.batch_responses({github_repos[0]: gs.GithubServiceError("no")})
+
+
 @pytest.fixture
 def mock_config_manager(mocker: MockerFixture) -> MockerFixture:
     """Fixture for mocking CONFIG_MANAGER."""
@@ -98,3 +126,86 @@ def test_execute_for_specific_repo(
 
     assert len(responses) == 1
     assert bool(responses[0]) is True
+
+
+def test_execute_concurrent_keeps_repo_order(
+    mock_config_manager: MockerFixture,
+) -> None:
+    """It runs repos at the same time and returns responses in repo order."""
+    config_manager = mock_config_manager.return_value
+    gh_use_case = OrderGhUseCase(config_manager, FakeGithubService(), jobs=2)
+    gh_use_case.second_done = threading.Event()
+
+    responses = gh_use_case.execute()
+
+    assert [response.value for response in responses] == [
+        f"{REPO} 1",
+        SUCCESS_MSG,
+        f"{REPO2} 1",
+        SUCCESS_MSG,
+    ]
+
+
+def test_execute_batch(
+    mock_config_manager: MockerFixture,
+) -> None:
+    """It runs action on repos left by the batch, keeping repo order."""
+    config_manager = mock_config_manager.return_value
+    gh_use_case = BatchGhUseCase(config_manager, FakeGithubService())
+
+    responses = gh_use_case.execute()
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == "no"
+    assert isinstance(responses[1], res.ResponseSuccess)
+    assert len(responses) == 2
+
+
+def test_batch_responses() -> None:
+    """It returns success or failure by repo."""
+    responses = gh.GhUseCase.batch_responses(
+        {REPO: SUCCESS_MSG, REPO2: gs.GithubServiceError(ERROR_MSG)}
+    )
+
+    assert responses[REPO][0].value == SUCCESS_MSG
+    assert responses[REPO2][0].value["message"] == ERROR_MSG
+
+
+def test_batch_issues(
+    mocker: MockerFixture,
+    mock_config_manager: MockerFixture,
+) -> None:
+    """It passes issues of repos with matches to one service call."""
+    mocker.patch(
+        "git_portfolio.views.issues",
+        side_effect=[
+            res.ResponseSuccess([DOMAIN_ISSUES[0]]),
+            res.ResponseFailure(res.ResponseTypes.RESOURCE_ERROR, ERROR_MSG),
+        ],
+    )
+    github_service = mocker.Mock()
+    github_service.close_issues_from_repos.return_value = {REPO: SUCCESS_MSG}
+    gh_use_case = FakeGhUseCase(mock_config_manager.return_value, github_service)
+
+    responses = gh_use_case.batch_issues(
+        "close_issues_from_repos", [REPO, REPO2], il.IssueListValidRequest()
+    )
+
+    github_service.close_issues_from_repos.assert_called_once_with(
+        {REPO: [DOMAIN_ISSUES[0]]}
+    )
+    assert list(responses) == [REPO]
+    assert responses[REPO][0].value == SUCCESS_MSG
+
+
+def test_execute_repos(
+    mock_config_manager: MockerFixture,
+) -> None:
+    """It runs only in the given repos."""
+    config_manager = mock_config_manager.return_value
+    gh_use_case = FakeGhUseCase(config_manager, FakeGithubService())
+
+    responses = gh_use_case.execute_repos([REPO2])
+
+    assert len(responses) == 1
+    assert responses[0].value == SUCCESS_MSG
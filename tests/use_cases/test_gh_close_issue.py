@@ -74,3 +74,24 @@ def test_action_failed(
 
     assert isinstance(response, res.ResponseFailure)
     assert f"{REPO}: no issues match search.\n" == response.value["message"]
+
+
+def test_execute_batch(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_views_issues: MockerFixture,
+) -> None:
+    """It closes listed issues of all repos with one call."""
+    config_manager = mock_config_manager.return_value
+    github_service = mock_github_service.return_value
+    github_service.close_issues_from_repos.return_value = {REPO: "closed\n"}
+    mock_views_issues.return_value = res.ResponseSuccess(["issue"])
+    use_case = ghci.GhCloseIssueUseCase(config_manager, github_service)
+
+    responses = use_case.execute(REQUEST_ISSUES)
+
+    assert responses[0].value == "closed\n"
+    github_service.close_issues_from_repos.assert_called_once_with(
+        {REPO: ["issue"]}
+    )
+    github_service.close_issues_from_repo.assert_not_called()
@@ -40,3 +40,22 @@ def test_action(
 
     assert isinstance(response, res.ResponseSuccess)
     assert SUCCESS_MSG == response.value
+
+
+def test_execute_batch(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+) -> None:
+    """It creates issues of batched repos without action."""
+    config_manager = mock_config_manager.return_value
+    github_service = mock_github_service.return_value
+    github_service.create_issue_from_repos.return_value = {REPO: SUCCESS_MSG}
+    use_case = ghci.GhCreateIssueUseCase(config_manager, github_service)
+
+    responses = use_case.execute(DOMAIN_ISSUES[0])
+
+    assert responses[0].value == SUCCESS_MSG
+    github_service.create_issue_from_repos.assert_called_once_with(
+        [REPO], DOMAIN_ISSUES[0]
+    )
+    github_service.create_issue_from_repo.assert_not_called()
@@ -101,3 +101,28 @@ def test_action_link_issue_e2e(
 
     assert isinstance(response, res.ResponseSuccess)
     assert response.value == SUCCESS_MSG
+
+
+def test_execute_skips_non_viable_repos(
+    mocker: MockerFixture,
+    mock_config_manager: MockerFixture,
+) -> None:
+    """It reports repos where the PR cannot be created without creating it."""
+    config_manager = mock_config_manager.return_value
+    github_service = FakeGithubService()
+    mocker.patch.object(
+        github_service,
+        "preflight_pull_requests",
+        return_value={REPO: "no commits\n"},
+    )
+    create = mocker.patch.object(github_service, "create_pull_request_from_repo")
+    use_case = ghcp.GhCreatePrUseCase(config_manager, github_service)
+
+    responses = use_case.execute(DOMAIN_PRS[0], REQUEST_ISSUES)
+
+    assert isinstance(responses[0], res.ResponseSuccess)
+    assert responses[0].value == "no commits\n"
+    github_service.preflight_pull_requests.assert_called_once_with(
+        [REPO], DOMAIN_PRS[0].base, DOMAIN_PRS[0].head
+    )
+    create.assert_not_called()
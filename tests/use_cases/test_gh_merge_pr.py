@@ -10,6 +10,7 @@ import git_portfolio.github_service as gs
 import git_portfolio.responses as res
 import git_portfolio.use_cases.gh_merge_pr as ghmp
 from tests.conftest import REPO
+from tests.conftest import REPO2
 
 
 @pytest.fixture
@@ -70,7 +71,7 @@ def test_action_delete_branch(
     mock_gh_delete_branch_use_case: MockerFixture,
     domain_mprs: list[mpr.PullRequestMerge],
 ) -> None:
-    """It returns success."""
+    """It keeps the repo for deletion after every merge."""
     config_manager = mock_config_manager.return_value
     github_service = mock_github_service.return_value
     use_case = ghmp.GhMergePrUseCase(config_manager, github_service)
@@ -80,7 +81,33 @@ def test_action_delete_branch(
 
     assert isinstance(response, res.ResponseSuccess)
     assert "success message\n" == response.value
-    mock_gh_delete_branch_use_case.assert_called_once()
+    assert use_case.merged_repos == [REPO]
+    assert not mock_gh_delete_branch_use_case.called
+
+
+def test_execute_delete_branch_merged_repos_only(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_gh_delete_branch_use_case: MockerFixture,
+    domain_mprs: list[mpr.PullRequestMerge],
+) -> None:
+    """It deletes branches of merged repos in one pass after the merges."""
+    config_manager = mock_config_manager.return_value
+    config_manager.config = c.Config("", "my-token", [REPO, REPO2])
+    github_service = mock_github_service.return_value
+    github_service.merge_pull_request_from_repo.side_effect = [
+        "success message\n",
+        gs.GithubServiceError("no PR"),
+    ]
+    delete_branch_use_case = mock_gh_delete_branch_use_case.return_value
+    delete_branch_use_case.execute_repos.return_value = [res.ResponseSuccess("del")]
+    use_case = ghmp.GhMergePrUseCase(config_manager, github_service, jobs=1)
+
+    responses = use_case.execute(domain_mprs[1])
+
+    assert [bool(response) for response in responses] == [True, False, True]
+    assert responses[2].value == "del"
+    delete_branch_use_case.execute_repos.assert_called_once_with([REPO], "main")
 
 
 def test_action_delete_branch_with_error(
@@ -113,9 +140,26 @@ def test_action_delete_branch_integration(
     github_service = mock_github_service.return_value
     use_case = ghmp.GhMergePrUseCase(config_manager, github_service)
 
-    use_case.action(REPO, domain_mprs[1])
-    response = use_case.responses[0]
+    responses = use_case.execute(domain_mprs[1])
 
-    assert isinstance(response, res.ResponseSuccess)
-    assert "success message\n" == response.value
-    github_service.delete_branch_from_repo.assert_called_once()
+    assert isinstance(responses[0], res.ResponseSuccess)
+    assert "success message\n" == responses[0].value
+    github_service.delete_branch_from_repo.assert_called_once_with(REPO, "main")
+
+
+def test_execute_skips_repos_without_pr(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    domain_mprs: list[mpr.PullRequestMerge],
+) -> None:
+    """It reports repos found without a pull request and does not merge them."""
+    config_manager = mock_config_manager.return_value
+    github_service = mock_github_service.return_value
+    github_service.preflight_merges.return_value = {REPO: "no PR\n"}
+    use_case = ghmp.GhMergePrUseCase(config_manager, github_service)
+
+    responses = use_case.execute(domain_mprs[0])
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == "no PR\n"
+    github_service.merge_pull_request_from_repo.assert_not_called()
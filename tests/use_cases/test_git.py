@@ -105,3 +105,21 @@ def test_execute_error_no_stderr(mock_popen: MockerFixture) -> None:
         f"{REPO_NAME}: On branch main\nYour branch is up to date with 'origin/main'."
         "\n\nnothing to commit, working tree clean\n"
     )
+
+
+def test_execute_parallel_keeps_order(mock_popen: MockerFixture) -> None:
+    """It returns one response per repo in the order of the repos."""
+    repos = [f"org/repo-{number}" for number in range(10)]
+    mock_popen.return_value.communicate.return_value = (b"", b"")
+    responses = git.GitUseCase(jobs=4).execute(repos, "fetch", ())
+
+    assert [response.value for response in responses] == [
+        f"repo-{number}: fetch successful.\n" for number in range(10)
+    ]
+
+
+def test_init_default_jobs(mocker: MockerFixture) -> None:
+    """It uses the number of CPUs as default number of jobs."""
+    mocker.patch("os.cpu_count", return_value=3)
+
+    assert git.GitUseCase().jobs == 3
@@ -1,9 +1,12 @@
 """Test cases for the git clone use case."""
+import pathlib
 from typing import Any
 
 import pytest
 from pytest_mock import MockerFixture
 
+import git_portfolio.domain.clone_options as co
+import git_portfolio.github_service as gs
 import git_portfolio.responses as res
 from git_portfolio.use_cases import git_clone as gcuc
 from tests.conftest import ERROR_MSG
@@ -66,11 +69,13 @@ def test_execute_git_not_installed(
 
 @pytest.mark.e2e
 def test_execute_git_not_installed_e2e(
-    mock_github_service: MockerFixture, mock_popen: MockerFixture
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_github_service: MockerFixture,
 ) -> None:
     """It returns failure with git not installed message."""
     github_service = mock_github_service.return_value
-    mock_popen.side_effect = FileNotFoundError
+    monkeypatch.setenv("PATH", str(tmp_path))
     responses = gcuc.GitCloneUseCase(github_service).execute([REPO])
 
     assert isinstance(responses[0], res.ResponseFailure)
@@ -102,3 +107,216 @@ def test_execute_error_during_execution(
         f"{REPO_NAME}: fatal: destination path '{REPO_NAME}' already exists and is not "
         "an empty directory.\n"
     )
+
+
+def test_execute_keeps_order(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It returns one response per repo in the order of the repos."""
+    github_service = mock_github_service.return_value
+    repos = [f"org/repo-{number}" for number in range(10)]
+    responses = gcuc.GitCloneUseCase(github_service, jobs=3).execute(repos)
+
+    assert [response.value for response in responses] == [
+        f"repo-{number}: clone successful.\n" for number in range(10)
+    ]
+
+
+def test_execute_as_completed(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It yields one response per repo."""
+    github_service = mock_github_service.return_value
+    responses = list(
+        gcuc.GitCloneUseCase(github_service).execute_as_completed([REPO, REPO2])
+    )
+
+    assert sorted(response.value for response in responses) == [
+        f"{REPO_NAME}2: clone successful.\n",
+        f"{REPO_NAME}: clone successful.\n",
+    ]
+
+
+def test_execute_repo_not_found(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It returns failure for the missing repo and clones the others."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.side_effect = [
+        NameError(f"Repository {REPO} not found."),
+        "git@github.com:org/repo-name2.git",
+    ]
+    responses = gcuc.GitCloneUseCase(github_service).execute([REPO, REPO2])
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == (
+        f"{REPO_NAME}: Repository {REPO} not found.\n"
+    )
+    assert isinstance(responses[1], res.ResponseSuccess)
+
+
+def test_execute_with_options(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It passes shallow and partial clone options to git."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.return_value = "git@github.com:org/repo-name.git"
+    options = co.CloneOptions(1, "blob:none", True)
+    gcuc.GitCloneUseCase(github_service, options=options).execute([REPO])
+
+    assert mock_popen.call_args.args[0] == [
+        "git",
+        "clone",
+        "--depth=1",
+        "--filter=blob:none",
+        "--single-branch",
+        "git@github.com:org/repo-name.git",
+    ]
+
+
+def test_execute_with_reference_cache(
+    mocker: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It refreshes the mirror and clones using it as reference."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.return_value = "url"
+    mirror_cache = mocker.Mock()
+    mirror_cache.refresh.return_value = ""
+    mirror_cache.mirror_path.return_value = "/cache/org/repo-name.git"
+    options = co.CloneOptions(reference_cache=True)
+    gcuc.GitCloneUseCase(github_service, 1, options, mirror_cache).execute([REPO])
+
+    mirror_cache.refresh.assert_called_once_with(REPO, "url")
+    assert mock_popen.call_args.args[0] == [
+        "git",
+        "clone",
+        "--reference-if-able=/cache/org/repo-name.git",
+        "--dissociate",
+        "url",
+    ]
+
+
+def test_execute_with_reference_cache_error(
+    mocker: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It clones without reference when the mirror cannot be refreshed."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.return_value = "url"
+    mirror_cache = mocker.Mock()
+    mirror_cache.refresh.return_value = ERROR_MSG
+    options = co.CloneOptions(reference_cache=True)
+    responses = gcuc.GitCloneUseCase(
+        github_service, 1, options, mirror_cache
+    ).execute([REPO])
+
+    assert isinstance(responses[0], res.ResponseSuccess)
+    assert mock_popen.call_args.args[0] == ["git", "clone", "url"]
+
+
+def test_execute_skip_existing(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It clones only repos missing in the workspace."""
+    (tmp_path / REPO_NAME).mkdir()
+    monkeypatch.chdir(tmp_path)
+    github_service = mock_github_service.return_value
+    options = co.CloneOptions(existing="skip")
+    responses = gcuc.GitCloneUseCase(github_service, options=options).execute(
+        [REPO, REPO2]
+    )
+
+    assert responses[0].value == f"{REPO_NAME}: already cloned.\n"
+    assert responses[1].value == f"{REPO_NAME}2: clone successful.\n"
+    github_service.get_repo_url.assert_called_once_with(REPO2)
+    assert mock_popen.call_count == 1
+
+
+def test_execute_fetch_existing(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It fetches repos already in the workspace."""
+    (tmp_path / REPO_NAME).mkdir()
+    monkeypatch.chdir(tmp_path)
+    github_service = mock_github_service.return_value
+    options = co.CloneOptions(existing="fetch")
+    responses = gcuc.GitCloneUseCase(github_service, options=options).execute([REPO])
+
+    assert responses[0].value == f"{REPO_NAME}: already cloned, fetch successful.\n"
+    assert mock_popen.call_args.args[0] == ["git", "fetch"]
+    assert mock_popen.call_args.kwargs["cwd"] == str(tmp_path / REPO_NAME)
+    github_service.get_repo_url.assert_not_called()
+
+
+def test_execute_fetch_existing_error(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It returns fetch error."""
+    (tmp_path / REPO_NAME).mkdir()
+    monkeypatch.chdir(tmp_path)
+    mock_popen.return_value.returncode = 1
+    mock_popen.return_value.communicate.return_value = (b"", ERROR_MSG.encode())
+    github_service = mock_github_service.return_value
+    options = co.CloneOptions(existing="fetch")
+    responses = gcuc.GitCloneUseCase(github_service, options=options).execute([REPO])
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == f"{REPO_NAME}: {ERROR_MSG}"
+
+
+def test_execute_github_service_error(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It returns failure when GitHub cannot be reached."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.side_effect = gs.GithubServiceError(ERROR_MSG)
+    responses = gcuc.GitCloneUseCase(github_service).execute([REPO])
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == f"{REPO_NAME}: {ERROR_MSG}\n"
+    mock_popen.assert_not_called()
+
+
+def test_execute_repository_error(
+    mock_github_service: MockerFixture,
+    mock_command_checker: MockerFixture,
+    mock_popen: MockerFixture,
+) -> None:
+    """It returns failure for an inaccessible repository and clones the others."""
+    github_service = mock_github_service.return_value
+    github_service.get_repo_url.side_effect = [
+        gs.GithubServiceError(f"{REPO}: {ERROR_MSG}\n"),
+        "git@github.com:org/repo-name2.git",
+    ]
+    responses = gcuc.GitCloneUseCase(github_service).execute([REPO, REPO2])
+
+    assert isinstance(responses[0], res.ResponseFailure)
+    assert responses[0].value["message"] == f"{REPO_NAME}: {REPO}: {ERROR_MSG}\n"
+    assert isinstance(responses[1], res.ResponseSuccess)
@@ -65,8 +65,11 @@ def test_execute_no_folder(
     )
 
 
-def test_execute_error_during_execution(mock_popen: MockerFixture) -> None:
+def test_execute_error_during_execution(
+    mock_command_checker: MockerFixture, mock_popen: MockerFixture
+) -> None:
     """It returns error message."""
+    mock_command_checker.return_value = ""
     mock_popen.return_value.returncode = 1
     mock_popen().communicate.return_value = (
         b"ValueError\n\nPackage nonexistingpackage not found",